@@ -1,492 +1,566 @@
-import tkinter as tk
-from tkinter import ttk
-from tkinterdnd2 import TkinterDnD, DND_FILES
-import os
-from collections import defaultdict
-import string
-
-class ColumnaBase:
-    def __init__(self, parent_frame, titulo, fuente):
-        self.datos = []
-        self.frame = ttk.LabelFrame(parent_frame, text=titulo, style='TitleFrame.TLabelframe')
-        self.frame.pack(side=tk.LEFT, padx=5, expand=True)
-        
-        style = ttk.Style()
-        style.configure("Custom.Treeview", font=('Helvetica', 16), rowheight=25)
-        style.configure("Custom.Treeview.Heading", font=('Helvetica', 16, 'bold'))
-        
-        # Modificar la altura del frame para mostrar más elementos
-        self.frame.configure(height=400)  # Aumentar altura del frame
-        
-        self.tree = ttk.Treeview(self.frame, columns=(titulo,), show='', style="Custom.Treeview")
-        self.tree.column(titulo, width=150, anchor='center')
-        self.tree.pack(fill=tk.BOTH, expand=True)
-        
-        self.tree.bind('<Button-1>', lambda e: 'break')
-            
-    def limpiar(self):
-        self.datos.clear()
-        for item in self.tree.get_children():
-            self.tree.delete(item)    
-            
-    def actualizar(self, nuevos_datos):
-        self.limpiar()
-        self.datos = nuevos_datos
-        # Ajustar la altura del Treeview para mostrar todos los elementos
-        self.tree.configure(height=max(len(nuevos_datos), 10))  # Mínimo 10 filas visibles
-        max_width = max((len(str(dato)) for dato in nuevos_datos), default=5) * 15
-        self.tree.column(self.tree["columns"][0], width=max(max_width, 150))  # Mínimo 150px de ancho
-        for dato in self.datos:
-            self.tree.insert('', 'end', values=(dato,))
-
-
-class ColumnaQ(ColumnaBase):
-    def __init__(self, parent_frame, fuente):
-        super().__init__(parent_frame, "Q", fuente)
-
-class ColumnaZ(ColumnaBase):
-    def __init__(self, parent_frame, fuente):
-        super().__init__(parent_frame, "Z", fuente)
-
-class ColumnaA(ColumnaBase):
-    def __init__(self, parent_frame, fuente):
-        super().__init__(parent_frame, "A", fuente)
-
-
-class AFNtoAFD:
-    def __init__(self, estados, alfabeto, transiciones, estado_inicial, estados_finales):
-        self.estados = estados
-        self.alfabeto = alfabeto
-        self.transiciones = transiciones
-        self.estado_inicial = estado_inicial
-        self.estados_finales = estados_finales
-        self.afd = {}
-
-
-    def cerradura_e(self, estados):
-        pila = list(estados)
-        cerradura = set(estados)
-        while pila:
-            estado = pila.pop()
-            if ('e', estado) in self.transiciones:
-                for destino in self.transiciones[('e', estado)]:
-                    if destino not in cerradura:
-                        cerradura.add(destino)
-                        pila.append(destino)
-        return frozenset(cerradura)
-
-    def mueve(self, estados, simbolo):
-        resultado = set()
-        for estado in estados:
-            if (simbolo, estado) in self.transiciones:
-                resultado.update(self.transiciones[(simbolo, estado)])
-        return resultado
-
-
-    def convertir(self):
-        T0 = self.cerradura_e({self.estado_inicial})
-        estados_sin_marcar = [T0]
-        estados_afd = [T0]
-        estado_sumidero = frozenset()
-
-        while estados_sin_marcar:
-            T = estados_sin_marcar.pop(0)
-            for x in self.alfabeto:
-                if x != 'e':
-                    U = self.cerradura_e(self.mueve(T, x))
-                    if not U:
-                        U = estado_sumidero
-                    if U not in estados_afd:
-                        estados_afd.append(U)
-                        if U != estado_sumidero:
-                            estados_sin_marcar.append(U)
-                    self.afd[(T, x)] = U
-
-        if estado_sumidero in estados_afd:
-            for x in self.alfabeto:
-                if x != 'e':
-                    self.afd[(estado_sumidero, x)] = estado_sumidero
-
-        return self.afd
-
-    def obtener_estados_finales_afd(self):
-        estados_finales_afd = []
-        for estado_afd in set(estado for estado, _ in self.afd.keys()):
-            if any(estado in self.estados_finales for estado in estado_afd):
-                estados_finales_afd.append(estado_afd)
-        return estados_finales_afd
-
-    
-class MatrizDividida:
-    def __init__(self, parent_frame_afn, parent_frame_afd, fuente):
-        self.datos = {}
-        self.estados_finales = set()
-        self.estados_afd_finales = set()
-        
-        self.frame_afn = ttk.Frame(parent_frame_afn)
-        self.frame_afn.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        
-        self.frame_afd = ttk.Frame(parent_frame_afd)
-        self.frame_afd.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        
-        style = ttk.Style()
-        style.configure("MatrixTreeview.Treeview", font=('Helvetica', 12), rowheight=25)  # Estilo específico para matrices
-        
-        self.tree_afn = ttk.Treeview(self.frame_afn, show='headings', style="MatrixTreeview.Treeview")
-        self.tree_afn.pack(fill="both", expand=True)
-        
-        self.tree_afd = ttk.Treeview(self.frame_afd, show='headings', style="MatrixTreeview.Treeview")
-        self.tree_afd.pack(fill="both", expand=True)
-        
-        self.mapeo_estados = {}
-        self.mapeo_estados_inverso = {}
-
-    def guardar_estado_final(self, estado_final_afd):
-        self.estados_afd_finales.add(estado_final_afd)
-
-    
-    def obtener_estados_finales_afd(self):
-        return self.estados_afd_finales
-
-
-    def _create_treeview(self, parent):
-        tree = ttk.Treeview(parent, show='headings', style="Custom.Treeview")
-        tree.pack(fill="both", expand=True)
-        return tree
-  
-        # Scrollbars
-        scrollbar_y = ttk.Scrollbar(parent, orient="vertical", command=tree.yview)
-        scrollbar_x = ttk.Scrollbar(parent, orient="horizontal", command=tree.xview)
-        tree.configure(yscrollcommand=scrollbar_y.set, xscrollcommand=scrollbar_x.set)
-        
-        scrollbar_y.pack(side="right", fill="y")
-        scrollbar_x.pack(side="bottom", fill="x")
-        
-        # Configurar altura fija del Treeview
-        tree.configure(height=8)
-        
-        return tree
-        
-    def _create_treeview(self, parent):
-        tree = ttk.Treeview(parent, show='headings', style="Custom.Treeview")
-        scrollbar_y = ttk.Scrollbar(parent, orient="vertical", command=tree.yview)
-        scrollbar_x = ttk.Scrollbar(parent, orient="horizontal", command=tree.xview)
-        tree.configure(yscrollcommand=scrollbar_y.set, xscrollcommand=scrollbar_x.set)
-        
-        scrollbar_y.pack(side="right", fill="y")
-        scrollbar_x.pack(side="bottom", fill="x")
-        tree.pack(fill="both", expand=True)
-        
-        return tree
-        
-    def limpiar(self):
-        self.datos.clear()
-        for tree in [self.tree_afn, self.tree_afd]:
-            for item in tree.get_children():
-                tree.delete(item)
-
-            
-    def actualizar(self, nuevos_datos, estados_finales):
-        self.limpiar()
-        self.datos = nuevos_datos
-        self.estados_finales = set(estados_finales)
-        
-        self._actualizar_afn()
-        estados_afd, simbolos_afd, estados_finales_afd = self._actualizar_afd()
-        
-        if hasattr(self, 'parent'):
-            self.parent.columna_q_afd.actualizar(estados_afd)
-            self.parent.columna_z_afd.actualizar(simbolos_afd)
-            self.parent.columna_a_afd.actualizar(estados_finales_afd)
-
-
-    def _actualizar_afn(self):
-        estados = sorted(set(estado for estado, _ in self.datos.keys()))
-        simbolos = sorted(set(simbolo for _, simbolo in self.datos.keys()))
-        
-        self.tree_afn["columns"] = ["Estado"] + simbolos
-        
-        estado_width = max((len(str(estado)) for estado in estados), default=5) * 12
-        self.tree_afn.column("Estado", width=estado_width, anchor="center")
-        self.tree_afn.heading("Estado", text="Estado")
-        
-        for simbolo in simbolos:
-            max_width = max((len(str(self.datos.get((estado, simbolo), ""))) 
-                           for estado in estados), default=5) * 12
-            self.tree_afn.column(simbolo, width=max_width, anchor="center")
-            self.tree_afn.heading(simbolo, text=simbolo)
-        
-        self.tree_afn.configure(height=len(estados))
-        
-        for estado in estados:
-            valores = [estado]
-            for simbolo in simbolos:
-                destinos = self.datos.get((estado, simbolo), "")
-                valores.append(destinos)
-            self.tree_afn.insert("", "end", values=valores)
-
-
-
-    def _mapear_estados(self, estados_afd):
-        mapeo = {}
-        letras = list(string.ascii_uppercase)
-        numeros = list(range(1, len(estados_afd) + 1))
-        
-        estados_tipo_letra = True
-        for estado in estados_afd:
-            estado_str = ','.join(sorted(estado)) if estado else '0'
-            if any(c.isdigit() for c in estado_str) or estado_str == '0':
-                estados_tipo_letra = False
-                break
-            if any(not c.isalpha() for c in estado_str if c.strip()):
-                estados_tipo_letra = False
-                break
-        
-        estados_ordenados = sorted(estados_afd, key=lambda x: ','.join(sorted(x)) if x else '0')
-        
-        for i, estado in enumerate(estados_ordenados):
-            if estados_tipo_letra:
-                mapeo[estado] = str(numeros[i])
-            else:
-                mapeo[estado] = letras[i] if i < len(letras) else f'Z{i - len(letras) + 1}'
-        
-        return mapeo
-        
-    def _actualizar_afd(self):
-        # Obtener estados, alfabeto y transiciones del AFN
-        estados = set()
-        alfabeto = set()
-        transiciones = {}
-        estado_inicial = None
-
-        for (estado, simbolo), destinos in self.datos.items():
-            estados.add(estado)
-            if simbolo != 'e':
-                alfabeto.add(simbolo)
-            if estado_inicial is None:
-                estado_inicial = estado
-            # Convertir destinos de string a conjunto
-            transiciones[(simbolo, estado)] = set(destinos.split(', ') if destinos else [])
-
-        # Convertir AFN a AFD
-        afn_to_afd = AFNtoAFD(estados, alfabeto, transiciones, estado_inicial, self.estados_finales)
-        afd = afn_to_afd.convertir()
-        estados_finales_afd = afn_to_afd.obtener_estados_finales_afd()
-
-        # Obtener todos los estados del AFD
-        estados_afd = set()
-        for (origen, _), destino in afd.items():
-            estados_afd.add(origen)
-            estados_afd.add(destino)
-
-        estado_inicial_afd = afn_to_afd.cerradura_e({estado_inicial})
-        estados_afd.add(estado_inicial_afd)
-        estados_afd = sorted(estados_afd, key=lambda x: ','.join(sorted(x)) if x else '0')
-        simbolos = sorted(alfabeto - {'e'})
-
-        # Mapear estados
-        self.mapeo_estados = self._mapear_estados(estados_afd)
-        self.mapeo_estados_inverso = {v: k for k, v in self.mapeo_estados.items()}
-
-        # Configurar columnas del AFD
-        columnas = ["Composicion", "Estado"] + simbolos
-        self.tree_afd["columns"] = columnas
-
-        # Configurar anchos de columna
-        comp_width = max((len('{' + ', '.join(sorted(estado)) + '}' if estado else '∅') 
-                         for estado in estados_afd), default=10) * 12
-        self.tree_afd.column("Composicion", width=comp_width, anchor="center")
-        self.tree_afd.heading("Composicion", text="Composicion")
-
-        estado_width = max((len(str(self.mapeo_estados[estado])) 
-                          for estado in estados_afd), default=5) * 12
-        self.tree_afd.column("Estado", width=estado_width, anchor="center")
-        self.tree_afd.heading("Estado", text="Estado")
-
-        for simbolo in simbolos:
-            self.tree_afd.column(simbolo, width=100, anchor="center")
-            self.tree_afd.heading(simbolo, text=simbolo)
-
-        # Insertar datos en el AFD
-        estados_mostrados = set()
-        for estado in estados_afd:
-            if estado not in estados_mostrados:
-                composicion = '{' + ', '.join(sorted(estado)) + '}' if estado else '∅'
-                valores = [composicion, self.mapeo_estados[estado]]
-                
-                for simbolo in simbolos:
-                    destino = afd.get((estado, simbolo), None)
-                    valores.append(self.mapeo_estados[destino] if destino is not None else '')
-                
-                self.tree_afd.insert("", "end", values=valores)
-                estados_mostrados.add(estado)
-
-        # Ajustar altura del AFD
-        self.tree_afd.configure(height=len(estados_mostrados))
-
-        # Preparar datos para las columnas del AFD
-        estados_afd_mapped = [self.mapeo_estados[estado] for estado in estados_afd]
-        estados_finales_afd_mapped = []
-        for estado in estados_finales_afd:
-            if estado in estados_mostrados:
-                estado_mapeado = self.mapeo_estados[estado]
-                estados_finales_afd_mapped.append(estado_mapeado)
-                self.guardar_estado_final(estado_mapeado)
-
-        return estados_afd_mapped, simbolos, sorted(estados_finales_afd_mapped)
-
-    
-class AutomataGUI:
-    def __init__(self):
-        self.root = TkinterDnD.Tk()
-        self.root.title("Laboratorio Automata                         Anthony Fabian Ramirez Orellana carne: 9490-22-958")
-        self.root.configure(bg="#b5b5b5")
-        
-        self.fuente_global = ('Helvetica', 16)
-        
-        # Nuevo: Almacenar datos del autómata
-        self.datos_automata = {
-            'estados_q': [],
-            'simbolos_z': [],
-            'estados_finales_a': [],
-            'transiciones_w': {},
-            'estados_finales_afd': set()
-        }
-        
-        self._crear_componentes()
-        
-    def _crear_componentes(self):
-        """Crea todos los componentes de la interfaz"""
-        # Cuadro de arrastre
-        self.cuadro_arrastre = tk.Label(self.root, text="Arrastre aquí:", relief="solid",
-                                       font=self.fuente_global, width=20, height=2, bg="#b5b5b5")
-        self.cuadro_arrastre.pack(pady=5)
-        
-        # Cuadro de texto
-        self.cuadro_texto = tk.Text(self.root, height=6, width=80, font=self.fuente_global)
-        self.cuadro_texto.pack(pady=5)
-        
-        # Frame principal que contendrá los dos lados
-        self.frame_principal = ttk.Frame(self.root)
-        self.frame_principal.pack(fill=tk.BOTH, expand=True, padx=10)
-        
-        # Frame izquierdo para AFN que se expande
-        self.frame_izquierdo = ttk.LabelFrame(self.frame_principal, text="AFN", style='Title.TLabelframe')
-        self.frame_izquierdo.pack(side=tk.LEFT, padx=5, pady=5, fill=tk.BOTH, expand=True)
-        
-        # Frame derecho para AFD que se expande
-        self.frame_derecho = ttk.LabelFrame(self.frame_principal, text="AFD", style='Title.TLabelframe')
-        self.frame_derecho.pack(side=tk.RIGHT, padx=5, pady=5, fill=tk.BOTH, expand=True)
-        
-        # Configurar estilos
-        style = ttk.Style()
-        style.configure("Custom.Treeview", font=('Helvetica', 16), rowheight=10)
-        style.configure("Custom.Treeview.Heading", font=('Helvetica', 16, 'bold'))
-        style.configure('Title.TLabelframe', font=('Helvetica', 16, 'bold'))
-        style.configure('Title.TLabelframe.Label', font=('Helvetica', 16, 'bold'))
-        style.configure('TitleFrame.TLabelframe', font=('Helvetica', 16, 'bold'))
-        style.configure('TitleFrame.TLabelframe.Label', font=('Helvetica', 16, 'bold'))
-        
-        # Frames para columnas con altura aumentada
-        self.frame_columnas_afn = ttk.Frame(self.frame_izquierdo, height=200)  # Aumentar altura
-        self.frame_columnas_afn.pack(fill=tk.X, padx=5, pady=5)
-        self.frame_columnas_afn.pack_propagate(False)
-        
-        self.frame_columnas_afd = ttk.Frame(self.frame_derecho, height=200)  # Aumentar altura
-        self.frame_columnas_afd.pack(fill=tk.X, padx=5, pady=5)
-        self.frame_columnas_afd.pack_propagate(False)
-        
-        # Crear columnas AFN y AFD
-        self.columna_q_afn = ColumnaQ(self.frame_columnas_afn, self.fuente_global)
-        self.columna_z_afn = ColumnaZ(self.frame_columnas_afn, self.fuente_global)
-        self.columna_a_afn = ColumnaA(self.frame_columnas_afn, self.fuente_global)
-        
-        self.columna_q_afd = ColumnaQ(self.frame_columnas_afd, self.fuente_global)
-        self.columna_z_afd = ColumnaZ(self.frame_columnas_afd, self.fuente_global)
-        self.columna_a_afd = ColumnaA(self.frame_columnas_afd, self.fuente_global)
-        
-        # Crear matriz
-        self.matriz = MatrizDividida(self.frame_izquierdo, self.frame_derecho, self.fuente_global)
-        self.matriz.parent = self
-        
-        # Configurar arrastrar y soltar
-        self.cuadro_arrastre.drop_target_register(DND_FILES)
-        self.cuadro_arrastre.dnd_bind('<<Drop>>', self._procesar_archivo)
-
-    def _procesar_archivo(self, event):
-        """Procesa el archivo arrastrado"""
-        archivo = event.data.strip("{}")
-        
-        if not os.path.isfile(archivo):
-            print("Error: no se encontró el archivo")
-            return
-            
-        with open(archivo, 'r') as f:
-            lines = f.readlines()
-            
-        # Limpiar el cuadro de texto
-        self.cuadro_texto.delete("1.0", tk.END)
-        for line in lines:
-            self.cuadro_texto.insert(tk.END, line)
-            
-        # Procesar cada línea
-        self.datos_automata = {
-            'estados_q': [],
-            'simbolos_z': [],
-            'estados_finales_a': [],
-            'transiciones_w': {},
-            'estados_finales_afd': set()
-        }
-        
-        for line in lines:
-            if line.startswith("Q="):
-                self.datos_automata['estados_q'] = [val.lstrip("{").strip() for val in line.strip()[2:-1].split(",")]
-            elif line.startswith("Z="):
-                self.datos_automata['simbolos_z'] = [val.lstrip("{").rstrip("}").strip() for val in line.strip()[2:-1].split(",")]
-            elif line.startswith("A="):
-                self.datos_automata['estados_finales_a'] = [val.lstrip("{").strip() for val in line.strip()[2:-1].split(",")]
-            elif line.startswith("w="):
-                w_values = line.strip()[2:-1].split(";")
-                for item in w_values:
-                    estado_inicio, elemento, estado_destino = item.strip()[1:-1].split(",")
-                    estado_inicio = estado_inicio.lstrip("{").lstrip("(").strip()
-                    elemento = elemento.strip()
-                    estado_destino = estado_destino.rstrip("}").rstrip(")").strip()
-                    
-                    key = (estado_inicio, elemento)
-                    if key not in self.datos_automata['transiciones_w']:
-                        self.datos_automata['transiciones_w'][key] = set()
-                    self.datos_automata['transiciones_w'][key].add(estado_destino)
-
-        # Convertir los conjuntos a cadenas en transiciones_w
-        self.datos_automata['transiciones_w'] = {
-            k: ', '.join(v) for k, v in self.datos_automata['transiciones_w'].items()
-        }
-
-        # Actualizar componentes
-        self._actualizar_interfaz()
-
-
-    def _actualizar_interfaz(self):
-        """Actualiza todos los componentes de la interfaz con los datos actuales"""
-        # Actualizar columnas AFN
-        self.columna_q_afn.actualizar(self.datos_automata['estados_q'])
-        self.columna_z_afn.actualizar(self.datos_automata['simbolos_z'])
-        self.columna_a_afn.actualizar(self.datos_automata['estados_finales_a'])
-        
-        # Actualizar matriz y obtener estados finales AFD
-        self.matriz.actualizar(self.datos_automata['transiciones_w'], self.datos_automata['estados_finales_a'])
-        
-        # Obtener estados finales del AFD después de la conversión
-        self.datos_automata['estados_finales_afd'] = self.matriz.obtener_estados_finales_afd()
-        
-        # Actualizar columna A del AFD con los estados finales convertidos
-        self.columna_a_afd.actualizar(sorted(self.datos_automata['estados_finales_a']))
-
-    def ejecutar(self):
-        self.root.mainloop()
-
-# Crear y ejecutar la aplicación
-if __name__ == "__main__":
-    app = AutomataGUI()
-    app.ejecutar()
+import tkinter as tk
+from tkinter import ttk
+from tkinterdnd2 import TkinterDnD, DND_FILES
+import os
+import queue
+import threading
+from collections import defaultdict
+from contextlib import nullcontext
+
+from motor_automatas import (AFN, AFNtoAFD, CacheDisco, ConversionCancelada, Perfil, leer_automata, modelo_afd,
+                             leer_archivo, modelo_afn, preparar_afd_conversor)
+from motor_automatas.perfil import fase
+
+class TablaVirtual:
+    """Treeview que solo tiene como items las filas visibles.
+
+    `filas` es cualquier secuencia (len y [i]) de listas de valores; al
+    desplazarse se reescriben los valores de esos mismos items, asi que el costo
+    de dibujar depende del alto de la ventana y no del tamano del automata.
+    Solo se tocan los items cuyo valor cambio.
+    """
+    def __init__(self, parent, filas_maximas=20, filas_minimas=0, **opciones):
+        self.filas_maximas = filas_maximas
+        self.filas_minimas = filas_minimas
+        self.filas = []
+        self.primera = 0
+        self.items = []
+        # Valores que muestra cada item, para no reescribir los que no cambian
+        self.valores = []
+
+        self.barra = ttk.Scrollbar(parent, orient="vertical", command=self._desplazar)
+        self.barra.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree = ttk.Treeview(parent, **opciones)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        # Windows y macOS mandan <MouseWheel>; X11 manda los botones 4 y 5
+        self.tree.bind('<MouseWheel>', self._rueda)
+        self.tree.bind('<Button-4>', self._rueda)
+        self.tree.bind('<Button-5>', self._rueda)
+
+    def mostrar(self, filas):
+        """Cambia las filas conservando la posicion de la barra si todavia cabe"""
+        self.filas = filas
+        visibles = min(len(filas), self.filas_maximas)
+        if len(self.items) > visibles:
+            # Un solo delete para todos los items que sobran
+            self.tree.delete(*self.items[visibles:])
+            del self.items[visibles:]
+            del self.valores[visibles:]
+        while len(self.items) < visibles:
+            self.items.append(self.tree.insert("", "end"))
+            self.valores.append(None)
+        self.primera = max(0, min(self.primera, len(filas) - visibles))
+        self.tree.configure(height=max(visibles, self.filas_minimas))
+        self._pintar()
+
+    def _pintar(self):
+        for i, item in enumerate(self.items):
+            valores = self.filas[self.primera + i]
+            if valores != self.valores[i]:
+                self.tree.item(item, values=valores)
+                self.valores[i] = valores
+        total = len(self.filas)
+        if total:
+            self.barra.set(self.primera / total, (self.primera + len(self.items)) / total)
+        else:
+            self.barra.set(0, 1)
+
+    def _ir_a(self, primera):
+        primera = max(0, min(primera, len(self.filas) - len(self.items)))
+        if primera != self.primera:
+            self.primera = primera
+            self._pintar()
+
+    def _desplazar(self, accion, cantidad, unidad=None):
+        """command de la barra: ('moveto', fraccion) o ('scroll', n, 'units'|'pages')"""
+        if accion == 'moveto':
+            self._ir_a(int(float(cantidad) * len(self.filas)))
+        elif accion == 'scroll':
+            paso = len(self.items) if unidad == 'pages' else 1
+            self._ir_a(self.primera + int(cantidad) * paso)
+
+    def _rueda(self, event):
+        arriba = event.num == 4 or getattr(event, 'delta', 0) > 0
+        self._ir_a(self.primera + (-3 if arriba else 3))
+        return 'break'
+
+
+class ColumnaBase:
+    def __init__(self, parent_frame, titulo, fuente):
+        self.datos = []
+        self.frame = ttk.LabelFrame(parent_frame, text=titulo, style='TitleFrame.TLabelframe')
+        self.frame.pack(side=tk.LEFT, padx=5, expand=True)
+        
+        style = ttk.Style()
+        style.configure("Custom.Treeview", font=('Helvetica', 16), rowheight=25)
+        style.configure("Custom.Treeview.Heading", font=('Helvetica', 16, 'bold'))
+        
+        # Modificar la altura del frame para mostrar más elementos
+        self.frame.configure(height=400)  # Aumentar altura del frame
+        
+        # Minimo 10 filas de alto; las que no entran se recorren con la barra
+        self.tabla = TablaVirtual(self.frame, filas_maximas=10, filas_minimas=10,
+                                  columns=(titulo,), show='', style="Custom.Treeview")
+        self.tree = self.tabla.tree
+        self.tree.column(titulo, width=150, anchor='center')
+        
+        self.tree.bind('<Button-1>', lambda e: 'break')
+            
+    def limpiar(self):
+        self.datos.clear()
+        self.tabla.mostrar([])
+            
+    def actualizar(self, nuevos_datos):
+        # Sin limpiar antes: la tabla solo reescribe las filas visibles que cambiaron
+        self.datos = nuevos_datos
+        max_width = max((len(str(dato)) for dato in nuevos_datos), default=5) * 15
+        self.tree.column(self.tree["columns"][0], width=max(max_width, 150))  # Mínimo 150px de ancho
+        self.tabla.mostrar([(dato,) for dato in self.datos])
+
+
+class ColumnaQ(ColumnaBase):
+    def __init__(self, parent_frame, fuente):
+        super().__init__(parent_frame, "Q", fuente)
+
+class ColumnaZ(ColumnaBase):
+    def __init__(self, parent_frame, fuente):
+        super().__init__(parent_frame, "Z", fuente)
+
+class ColumnaA(ColumnaBase):
+    def __init__(self, parent_frame, fuente):
+        super().__init__(parent_frame, "A", fuente)
+
+
+class MatrizDividida:
+    # Motor de conversion; AFNtoAFDBits produce el mismo AFD con mascaras de bits
+    clase_conversor = AFNtoAFD
+    # Mostrar el AFD minimo (Hopcroft) en lugar del resultado crudo de convertir()
+    mostrar_afd_minimo = True
+    # CacheDisco para no volver a convertir un automata ya visto (None = sin cache)
+    cache_conversiones = None
+    # Alto maximo de las tablas; el resto de los estados se recorre con la barra
+    filas_visibles = 25
+
+    def __init__(self, parent_frame_afn, parent_frame_afd, fuente):
+        self.afn = AFN()
+        # Ultimo conversor usado: la siguiente conversion reutiliza lo que no cambio
+        self.conversor_anterior = None
+        self.estados_afd_finales = set()
+        
+        self.frame_afn = ttk.Frame(parent_frame_afn)
+        self.frame_afn.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        self.frame_afd = ttk.Frame(parent_frame_afd)
+        self.frame_afd.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        style = ttk.Style()
+        style.configure("MatrixTreeview.Treeview", font=('Helvetica', 12), rowheight=25)  # Estilo específico para matrices
+        
+        # Solo las filas visibles existen como items del Treeview
+        self.tabla_afn = TablaVirtual(self.frame_afn, self.filas_visibles, show='headings',
+                                      style="MatrixTreeview.Treeview")
+        self.tree_afn = self.tabla_afn.tree
+        
+        self.tabla_afd = TablaVirtual(self.frame_afd, self.filas_visibles, show='headings',
+                                      style="MatrixTreeview.Treeview")
+        self.tree_afd = self.tabla_afd.tree
+        
+        self.mapeo_estados = {}
+        self.mapeo_estados_inverso = {}
+
+    def guardar_estado_final(self, estado_final_afd):
+        self.estados_afd_finales.add(estado_final_afd)
+
+    
+    def obtener_estados_finales_afd(self):
+        return self.estados_afd_finales
+
+
+    def _create_treeview(self, parent):
+        tree = ttk.Treeview(parent, show='headings', style="Custom.Treeview")
+        tree.pack(fill="both", expand=True)
+        return tree
+  
+        # Scrollbars
+        scrollbar_y = ttk.Scrollbar(parent, orient="vertical", command=tree.yview)
+        scrollbar_x = ttk.Scrollbar(parent, orient="horizontal", command=tree.xview)
+        tree.configure(yscrollcommand=scrollbar_y.set, xscrollcommand=scrollbar_x.set)
+        
+        scrollbar_y.pack(side="right", fill="y")
+        scrollbar_x.pack(side="bottom", fill="x")
+        
+        # Configurar altura fija del Treeview
+        tree.configure(height=8)
+        
+        return tree
+        
+    def _create_treeview(self, parent):
+        tree = ttk.Treeview(parent, show='headings', style="Custom.Treeview")
+        scrollbar_y = ttk.Scrollbar(parent, orient="vertical", command=tree.yview)
+        scrollbar_x = ttk.Scrollbar(parent, orient="horizontal", command=tree.xview)
+        tree.configure(yscrollcommand=scrollbar_y.set, xscrollcommand=scrollbar_x.set)
+        
+        scrollbar_y.pack(side="right", fill="y")
+        scrollbar_x.pack(side="bottom", fill="x")
+        tree.pack(fill="both", expand=True)
+        
+        return tree
+        
+    def limpiar(self):
+        self.afn = AFN()
+        for tabla in [self.tabla_afn, self.tabla_afd]:
+            tabla.mostrar([])
+
+            
+    def actualizar(self, afn, modelos=None):
+        """Dibuja ambas tablas; `modelos` es lo que devolvio preparar_modelos(afn), si ya se tiene.
+
+        Las tablas no se vacian antes: solo cambian las filas visibles distintas.
+        """
+        self.afn = afn
+        if modelos is None:
+            modelos = self.preparar_modelos(afn, self.convertir(afn))
+        tabla_afn, tabla_afd = modelos
+        
+        self._actualizar_afn(tabla_afn)
+        estados_afd, simbolos_afd, estados_finales_afd = self._actualizar_afd(tabla_afd)
+        
+        if hasattr(self, 'parent'):
+            self.parent.columna_q_afd.actualizar(estados_afd)
+            self.parent.columna_z_afd.actualizar(simbolos_afd)
+            self.parent.columna_a_afd.actualizar(estados_finales_afd)
+
+    def preparar_modelos(self, afn, resultado):
+        """Textos y anchos de las dos tablas, armados una sola vez; tampoco toca widgets"""
+        return modelo_afn(afn), modelo_afd(resultado)
+
+    def _configurar_columnas(self, tree, columnas, anchos):
+        tree["columns"] = columnas
+        for columna, ancho in zip(columnas, anchos):
+            tree.column(columna, width=ancho, anchor="center")
+            tree.heading(columna, text=columna)
+
+    def _actualizar_afn(self, modelo):
+        self._configurar_columnas(self.tree_afn, modelo.columnas, [ancho * 12 for ancho in modelo.anchos])
+        self.tabla_afn.mostrar(modelo.filas)
+
+    def convertir(self, afn, progreso=None, cancelar=None, perfil=None):
+        """Lo mismo que preparar_afd, pero conservando el conversor para la proxima edicion.
+
+        No toca ningun widget, asi que puede llamarse desde un hilo de trabajo.
+        """
+        resultado, self.conversor_anterior = preparar_afd_conversor(
+            afn, self.clase_conversor, self.mostrar_afd_minimo, self.cache_conversiones,
+            self.conversor_anterior, progreso, cancelar, perfil)
+        return resultado
+
+    def _actualizar_afd(self, modelo):
+        self.mapeo_estados = modelo.mapeo
+        self.mapeo_estados_inverso = modelo.inverso
+
+        # Composicion y Estado a la medida del texto; los simbolos con ancho fijo
+        anchos = [modelo.anchos[0] * 12, modelo.anchos[1] * 12] + [100] * len(modelo.simbolos)
+        self._configurar_columnas(self.tree_afd, modelo.columnas, anchos)
+        self.tabla_afd.mostrar(modelo.filas)
+
+        for estado_mapeado in modelo.finales:
+            self.guardar_estado_final(estado_mapeado)
+
+        return modelo.nombres, modelo.simbolos, modelo.finales
+
+    
+class AutomataGUI:
+    # Milisegundos sin escribir antes de convertir lo editado en cuadro_texto
+    retardo_edicion = 400
+    # Cada cuanto el hilo de Tk revisa si el hilo de conversion dejo un resultado
+    intervalo_resultados = 50
+    # Caracteres de un archivo que se ponen en cuadro_texto; de uno mas grande
+    # solo se muestra el principio (la conversion usa siempre el archivo completo)
+    limite_texto = 256 * 1024
+
+    def __init__(self):
+        self.root = TkinterDnD.Tk()
+        self.root.title("Laboratorio Automata                         Anthony Fabian Ramirez Orellana carne: 9490-22-958")
+        self.root.configure(bg="#b5b5b5")
+        
+        self.fuente_global = ('Helvetica', 16)
+        
+        # Nuevo: Almacenar datos del autómata
+        self.datos_automata = {
+            'estados_q': [],
+            'simbolos_z': [],
+            'estado_inicial': None,
+            'estados_finales_a': [],
+            'afn': AFN(),
+            'estados_finales_afd': set()
+        }
+
+        # Lectura y conversion en segundo plano: cada archivo o edicion sube la
+        # generacion, cancela el trabajo en curso y sus resultados se descartan
+        self.cola_resultados = queue.Queue()
+        self.generacion = 0
+        self.conversion_en_curso = False
+        self.trabajo_pendiente = None
+        self.evento_cancelar = threading.Event()
+        self.progreso = None
+        self.edicion_programada = None
+        self.texto_convertido = ''
+        # cuadro_texto muestra solo el principio de un archivo grande y no se edita
+        self.vista_previa = False
+        
+        self._crear_componentes()
+        self.root.after(self.intervalo_resultados, self._revisar_resultados)
+        
+    def _crear_componentes(self):
+        """Crea todos los componentes de la interfaz"""
+        # Cuadro de arrastre
+        self.cuadro_arrastre = tk.Label(self.root, text="Arrastre aquí:", relief="solid",
+                                       font=self.fuente_global, width=20, height=2, bg="#b5b5b5")
+        self.cuadro_arrastre.pack(pady=5)
+        
+        # Cuadro de texto
+        self.cuadro_texto = tk.Text(self.root, height=6, width=80, font=self.fuente_global, undo=True)
+        self.cuadro_texto.pack(pady=5)
+        self.cuadro_texto.bind('<<Modified>>', self._texto_modificado)
+
+        # Estado de la conversion en curso y boton para cancelarla
+        self.frame_estado = ttk.Frame(self.root)
+        self.frame_estado.pack(fill=tk.X, padx=10)
+        self.etiqueta_estado = ttk.Label(self.frame_estado, text="", font=('Helvetica', 12))
+        self.etiqueta_estado.pack(side=tk.LEFT)
+        self.boton_cancelar = ttk.Button(self.frame_estado, text="Cancelar", state='disabled',
+                                         command=self._cancelar_conversion)
+        self.boton_cancelar.pack(side=tk.RIGHT)
+        self.mostrar_perfil = tk.BooleanVar(value=False)
+        self.casilla_perfil = ttk.Checkbutton(self.frame_estado, text="Perfil", variable=self.mostrar_perfil,
+                                              command=self._alternar_perfil)
+        self.casilla_perfil.pack(side=tk.RIGHT, padx=5)
+
+        # Panel con el tiempo de cada fase de la ultima conversion (solo con "Perfil" marcado)
+        self.etiqueta_perfil = ttk.Label(self.root, text="", font=('Courier', 11), justify=tk.LEFT)
+        
+        # Frame principal que contendrá los dos lados
+        self.frame_principal = ttk.Frame(self.root)
+        self.frame_principal.pack(fill=tk.BOTH, expand=True, padx=10)
+        
+        # Frame izquierdo para AFN que se expande
+        self.frame_izquierdo = ttk.LabelFrame(self.frame_principal, text="AFN", style='Title.TLabelframe')
+        self.frame_izquierdo.pack(side=tk.LEFT, padx=5, pady=5, fill=tk.BOTH, expand=True)
+        
+        # Frame derecho para AFD que se expande
+        self.frame_derecho = ttk.LabelFrame(self.frame_principal, text="AFD", style='Title.TLabelframe')
+        self.frame_derecho.pack(side=tk.RIGHT, padx=5, pady=5, fill=tk.BOTH, expand=True)
+        
+        # Configurar estilos
+        style = ttk.Style()
+        style.configure("Custom.Treeview", font=('Helvetica', 16), rowheight=10)
+        style.configure("Custom.Treeview.Heading", font=('Helvetica', 16, 'bold'))
+        style.configure('Title.TLabelframe', font=('Helvetica', 16, 'bold'))
+        style.configure('Title.TLabelframe.Label', font=('Helvetica', 16, 'bold'))
+        style.configure('TitleFrame.TLabelframe', font=('Helvetica', 16, 'bold'))
+        style.configure('TitleFrame.TLabelframe.Label', font=('Helvetica', 16, 'bold'))
+        
+        # Frames para columnas con altura aumentada
+        self.frame_columnas_afn = ttk.Frame(self.frame_izquierdo, height=200)  # Aumentar altura
+        self.frame_columnas_afn.pack(fill=tk.X, padx=5, pady=5)
+        self.frame_columnas_afn.pack_propagate(False)
+        
+        self.frame_columnas_afd = ttk.Frame(self.frame_derecho, height=200)  # Aumentar altura
+        self.frame_columnas_afd.pack(fill=tk.X, padx=5, pady=5)
+        self.frame_columnas_afd.pack_propagate(False)
+        
+        # Crear columnas AFN y AFD
+        self.columna_q_afn = ColumnaQ(self.frame_columnas_afn, self.fuente_global)
+        self.columna_z_afn = ColumnaZ(self.frame_columnas_afn, self.fuente_global)
+        self.columna_a_afn = ColumnaA(self.frame_columnas_afn, self.fuente_global)
+        
+        self.columna_q_afd = ColumnaQ(self.frame_columnas_afd, self.fuente_global)
+        self.columna_z_afd = ColumnaZ(self.frame_columnas_afd, self.fuente_global)
+        self.columna_a_afd = ColumnaA(self.frame_columnas_afd, self.fuente_global)
+        
+        # Crear matriz
+        self.matriz = MatrizDividida(self.frame_izquierdo, self.frame_derecho, self.fuente_global)
+        self.matriz.parent = self
+        try:
+            self.matriz.cache_conversiones = CacheDisco(
+                os.path.join(os.path.expanduser('~'), '.cache', 'laboratorio_automata'))
+        except OSError:  # sin carpeta de cache se convierte siempre
+            pass
+        
+        # Configurar arrastrar y soltar
+        self.cuadro_arrastre.drop_target_register(DND_FILES)
+        self.cuadro_arrastre.dnd_bind('<<Drop>>', self._procesar_archivo)
+
+    def _procesar_archivo(self, event):
+        """Procesa el archivo arrastrado"""
+        archivo = event.data.strip("{}")
+        
+        if not os.path.isfile(archivo):
+            print("Error: no se encontró el archivo")
+            return
+
+        # La lectura y la conversion van en el hilo de trabajo
+        self._pedir_conversion(ruta=archivo)
+
+    def _texto_modificado(self, event):
+        """Reinicia la espera cada vez que cambia el texto"""
+        self.cuadro_texto.edit_modified(False)
+        if self.edicion_programada is not None:
+            self.root.after_cancel(self.edicion_programada)
+        self.edicion_programada = self.root.after(self.retardo_edicion, self._convertir_texto)
+
+    def _convertir_texto(self):
+        self.edicion_programada = None
+        if self.vista_previa:
+            return
+        texto = self.cuadro_texto.get("1.0", "end-1c")
+        if texto == self.texto_convertido:
+            return
+        self._pedir_conversion(texto=texto)
+
+    def _pedir_conversion(self, texto=None, ruta=None):
+        """Convierte el texto (o lee y convierte el archivo `ruta`) en el hilo de trabajo"""
+        if texto is not None:
+            self.texto_convertido = texto
+        self.generacion += 1
+        if self.conversion_en_curso:
+            # Un solo hilo a la vez: el actual queda viejo y se cancela, y este
+            # trabajo arranca cuando aquel termine
+            self.evento_cancelar.set()
+            self.trabajo_pendiente = (texto, ruta)
+            return
+        self._lanzar_conversion(texto, ruta)
+
+    def _lanzar_conversion(self, texto, ruta):
+        self.conversion_en_curso = True
+        self.evento_cancelar = threading.Event()
+        self.progreso = None
+        self.boton_cancelar.configure(state='normal')
+        self.etiqueta_estado.configure(text=f"Leyendo {os.path.basename(ruta)}..." if ruta else "Convirtiendo...")
+        perfil = Perfil() if self.mostrar_perfil.get() else None
+        threading.Thread(target=self._convertir_en_hilo,
+                         args=(self.generacion, texto, ruta, self.evento_cancelar, perfil),
+                         daemon=True).start()
+
+    def _convertir_en_hilo(self, generacion, texto, ruta, cancelar, perfil=None):
+        """Corre fuera del hilo de Tk: no toca widgets, solo deja el resultado en la cola"""
+        try:
+            with perfil or nullcontext():
+                vista_previa = False
+                with fase(perfil, 'lectura'):
+                    if ruta is not None:
+                        # El archivo se lee con mmap; cuadro_texto recibe a lo sumo limite_texto caracteres
+                        datos = leer_archivo(ruta)
+                        texto, vista_previa = self._texto_archivo(ruta)
+                    else:
+                        datos = leer_automata([texto])
+                if cancelar.is_set():
+                    raise ConversionCancelada("conversion cancelada")
+                resultado = self.matriz.convertir(datos['afn'], self._reportar_progreso, cancelar, perfil)
+                # Los textos de las tablas tambien se arman aqui; el hilo de Tk solo los muestra
+                with fase(perfil, 'tablas'):
+                    modelos = self.matriz.preparar_modelos(datos['afn'], resultado)
+            self.cola_resultados.put((generacion, texto, vista_previa, ruta, datos, modelos, perfil, None))
+        except Exception as error:
+            self.cola_resultados.put((generacion, texto, False, ruta, None, None, perfil, error))
+
+    def _texto_archivo(self, ruta):
+        """(texto para cuadro_texto, es_vista_previa): el archivo completo, o su
+        principio con un aviso si pasa de limite_texto caracteres"""
+        with open(ruta, 'r', errors='replace') as f:
+            texto = f.read(self.limite_texto)
+            if not f.read(1):
+                return texto, False
+            tamano = os.fstat(f.fileno()).st_size
+        # Cortar en el ultimo salto de linea para no dejar una linea a medias
+        texto = texto[:texto.rfind('\n') + 1] or texto
+        aviso = (f"... vista previa: {os.path.basename(ruta)} tiene {tamano / 1024 / 1024:.1f} MB; "
+                 f"se convirtio completo pero aqui solo se muestra el principio")
+        return texto + aviso, True
+
+    def _reportar_progreso(self, estados, pendientes):
+        # Llamado desde el hilo de trabajo: solo se guarda, _revisar_resultados lo muestra
+        self.progreso = (estados, pendientes)
+
+    def _cancelar_conversion(self):
+        if self.conversion_en_curso:
+            self.evento_cancelar.set()
+            self.etiqueta_estado.configure(text="Cancelando...")
+
+    def _alternar_perfil(self):
+        """Muestra u oculta el panel de perfil; se llena con la proxima conversion"""
+        if self.mostrar_perfil.get():
+            self.etiqueta_perfil.configure(text="El perfil aparece en la proxima conversion")
+            self.etiqueta_perfil.pack(after=self.frame_estado, fill=tk.X, padx=10)
+        else:
+            self.etiqueta_perfil.pack_forget()
+
+    def _revisar_resultados(self):
+        """Aplica en el hilo de Tk lo que dejo el hilo de conversion"""
+        try:
+            while True:
+                generacion, texto, vista_previa, ruta, datos, modelos, perfil, error = self.cola_resultados.get_nowait()
+                self.conversion_en_curso = False
+                self.boton_cancelar.configure(state='disabled')
+                if generacion != self.generacion:
+                    continue
+                if isinstance(error, ConversionCancelada):
+                    self.etiqueta_estado.configure(text="Conversion cancelada")
+                elif error is not None:
+                    print(f"Error: {error}")
+                    self.etiqueta_estado.configure(text=f"Error: {error}")
+                else:
+                    if ruta is not None:
+                        self._mostrar_archivo(texto, vista_previa)
+                    self.datos_automata = datos
+                    with fase(perfil, 'interfaz'):
+                        self._actualizar_interfaz(modelos)
+                    self.etiqueta_estado.configure(text=f"AFD con {len(modelos[1].filas)} estados")
+                if perfil is not None:
+                    self.etiqueta_perfil.configure(text=perfil.resumen())
+        except queue.Empty:
+            pass
+        if self.conversion_en_curso and self.progreso is not None:
+            estados, pendientes = self.progreso
+            self.etiqueta_estado.configure(
+                text=f"Convirtiendo: {estados} estados del AFD, {pendientes} por procesar")
+        if self.trabajo_pendiente is not None and not self.conversion_en_curso:
+            texto, ruta = self.trabajo_pendiente
+            self.trabajo_pendiente = None
+            self._lanzar_conversion(texto, ruta)
+        self.root.after(self.intervalo_resultados, self._revisar_resultados)
+
+    def _mostrar_archivo(self, texto, vista_previa):
+        """Pone el texto del archivo en cuadro_texto; una vista previa queda de solo lectura"""
+        # La edicion que dispara el insert no reconvierte
+        self.texto_convertido = texto
+        self.vista_previa = vista_previa
+        self.cuadro_texto.configure(state='normal')
+        self.cuadro_texto.delete("1.0", tk.END)
+        self.cuadro_texto.insert(tk.END, texto)
+        if vista_previa:
+            self.cuadro_texto.configure(state='disabled')
+
+    def _actualizar_interfaz(self, modelos=None):
+        """Actualiza todos los componentes de la interfaz con los datos actuales"""
+        # Actualizar columnas AFN
+        self.columna_q_afn.actualizar(self.datos_automata['estados_q'])
+        self.columna_z_afn.actualizar(self.datos_automata['simbolos_z'])
+        self.columna_a_afn.actualizar(self.datos_automata['estados_finales_a'])
+        
+        # Actualizar matriz y obtener estados finales AFD
+        self.matriz.actualizar(self.datos_automata['afn'], modelos)
+        
+        # Obtener estados finales del AFD después de la conversión
+        self.datos_automata['estados_finales_afd'] = self.matriz.obtener_estados_finales_afd()
+        
+        # Actualizar columna A del AFD con los estados finales convertidos
+        self.columna_a_afd.actualizar(sorted(self.datos_automata['estados_finales_a']))
+
+    def ejecutar(self):
+        self.root.mainloop()
+
+# Crear y ejecutar la aplicación
+if __name__ == "__main__":
+    app = AutomataGUI()
+    app.ejecutar()
@@ -0,0 +1,44 @@
+"""Motor de automatas sin interfaz grafica.
+
+Lectura de archivos Q=/Z=/i=/A=/w=, conversion AFN -> AFD, minimizacion,
+evaluacion de cadenas y preparacion de las tablas. Nada de este paquete
+importa tkinter, asi que se puede usar desde scripts y servidores.
+"""
+from .afn import AFN, AFNCompacto
+from .cache import CacheDisco, huella_afn
+from .compilado import AFDCompilado, ResultadoEscaneo
+from .conversion import AFNtoAFD, AFNtoAFDBits, CacheLRU, ConversionCancelada
+from .lector import leer_afn, leer_afn_archivo, leer_archivo, leer_automata
+from .minimizacion import minimizar_afd
+from .perfil import Perfil
+from .presentacion import (construir_conversor, convertir_afn, mapear_estados, modelo_afd, modelo_afn,
+                           preparar_afd, preparar_afd_conversor, presentar_afd)
+from .simulacion import SimuladorAFN
+
+__all__ = [
+    'AFN',
+    'AFNCompacto',
+    'AFDCompilado',
+    'AFNtoAFD',
+    'AFNtoAFDBits',
+    'CacheDisco',
+    'CacheLRU',
+    'ConversionCancelada',
+    'Perfil',
+    'ResultadoEscaneo',
+    'SimuladorAFN',
+    'construir_conversor',
+    'convertir_afn',
+    'huella_afn',
+    'leer_afn',
+    'leer_afn_archivo',
+    'leer_archivo',
+    'leer_automata',
+    'mapear_estados',
+    'minimizar_afd',
+    'modelo_afd',
+    'modelo_afn',
+    'preparar_afd',
+    'preparar_afd_conversor',
+    'presentar_afd',
+]
@@ -0,0 +1,5 @@
+import sys
+
+from .lote import main
+
+sys.exit(main())
@@ -0,0 +1,156 @@
+"""Representacion interna de un AFN con estados y simbolos numerados"""
+from array import array
+from itertools import accumulate, chain
+
+
+class AFN:
+    """AFN leido de un archivo Q=/Z=/i=/A=/w=.
+
+    Los estados y simbolos se numeran en el orden en que aparecen (primero los
+    declarados en Q= y Z=); las transiciones son tres arreglos paralelos de
+    enteros: origenes[k] --simbolos_transicion[k]--> destinos[k].
+    """
+    __slots__ = ('estados', 'indice_estados', 'simbolos', 'indice_simbolos',
+                 'declarados_q', 'declarados_z', 'inicial', 'finales',
+                 'origenes', 'simbolos_transicion', 'destinos')
+
+    def __init__(self):
+        self.estados = []
+        self.indice_estados = {}
+        self.simbolos = []
+        self.indice_simbolos = {}
+        # Cuantos de los primeros estados/simbolos venian declarados en Q= y Z=
+        self.declarados_q = 0
+        self.declarados_z = 0
+        self.inicial = None
+        self.finales = []
+        self.origenes = array('i')
+        self.simbolos_transicion = array('i')
+        self.destinos = array('i')
+
+    def agregar_estado(self, nombre):
+        i = self.indice_estados.get(nombre)
+        if i is None:
+            i = self.indice_estados[nombre] = len(self.estados)
+            self.estados.append(nombre)
+        return i
+
+    def agregar_simbolo(self, simbolo):
+        i = self.indice_simbolos.get(simbolo)
+        if i is None:
+            i = self.indice_simbolos[simbolo] = len(self.simbolos)
+            self.simbolos.append(simbolo)
+        return i
+
+    def agregar_transicion(self, origen, simbolo, destino):
+        self.origenes.append(origen)
+        self.simbolos_transicion.append(simbolo)
+        self.destinos.append(destino)
+
+    def __len__(self):
+        return len(self.origenes)
+
+    def transiciones(self):
+        """Tripletas (origen, simbolo, destino) con los nombres originales"""
+        estados = self.estados
+        simbolos = self.simbolos
+        for origen, simbolo, destino in zip(self.origenes, self.simbolos_transicion, self.destinos):
+            yield estados[origen], simbolos[simbolo], estados[destino]
+
+    def agrupar(self):
+        """{(origen, simbolo): [destinos]} con indices y sin destinos repetidos"""
+        # Un dict por clave hace de conjunto que conserva el orden de aparicion
+        tabla = {}
+        for clave, destino in zip(zip(self.origenes, self.simbolos_transicion), self.destinos):
+            destinos = tabla.get(clave)
+            if destinos is None:
+                tabla[clave] = {destino: None}
+            else:
+                destinos[destino] = None
+        return {clave: list(destinos) for clave, destinos in tabla.items()}
+
+    def estado_inicial(self):
+        """Nombre del estado inicial, o None si el automata no tiene ninguno.
+
+        El estado declarado en i= solo se usa si de verdad es un estado del
+        automata; si no, se toma el origen de la primera transicion.
+        """
+        if self.inicial is not None and (self.inicial < self.declarados_q
+                                         or self.inicial in self.origenes or self.inicial in self.destinos):
+            return self.estados[self.inicial]
+        if self.origenes:
+            return self.estados[self.origenes[0]]
+        return None
+
+
+class AFNCompacto:
+    """Transiciones de un AFN en formato CSR, un par de arreglos por simbolo.
+
+    Los destinos del estado i con el simbolo x son
+    destinos[x][desplazamientos[x][i]:desplazamientos[x][i + 1]], ordenados y sin
+    repetidos. Ocupa unos pocos bytes por transicion, frente a la tupla, el set y
+    las entradas de diccionario de AFNtoAFD.transiciones.
+    """
+    __slots__ = ('estados', 'indice_estados', 'simbolos', 'indice_simbolos',
+                 'desplazamientos', 'destinos')
+
+    def __init__(self, estados, simbolos, desplazamientos, destinos):
+        self.estados = list(estados)
+        self.indice_estados = {nombre: i for i, nombre in enumerate(self.estados)}
+        self.simbolos = list(simbolos)
+        self.indice_simbolos = {simbolo: i for i, simbolo in enumerate(self.simbolos)}
+        self.desplazamientos = desplazamientos
+        self.destinos = destinos
+
+    @classmethod
+    def _desde_filas(cls, estados, simbolos, filas):
+        """filas: {(origen, simbolo): destinos}, todo con indices"""
+        n = len(estados)
+        conteos = [array('i', bytes(4 * (n + 1))) for _ in simbolos]
+        for (origen, x), destinos in filas.items():
+            conteos[x][origen + 1] = len(destinos)
+        desplazamientos = [array('i', accumulate(conteo)) for conteo in conteos]
+        destinos_csr = [array('i', bytes(4 * d[-1])) for d in desplazamientos]
+        for (origen, x), destinos in filas.items():
+            inicio = desplazamientos[x][origen]
+            destinos_csr[x][inicio:inicio + len(destinos)] = array('i', sorted(destinos))
+        return cls(estados, simbolos, desplazamientos, destinos_csr)
+
+    @classmethod
+    def desde_afn(cls, afn):
+        return cls._desde_filas(afn.estados, afn.simbolos, afn.agrupar())
+
+    @classmethod
+    def desde_transiciones(cls, transiciones):
+        """Desde un diccionario {(simbolo, estado): {destinos}} como AFNtoAFD.transiciones"""
+        estados = {}
+        simbolos = {}
+        filas = {}
+        for (simbolo, estado), destinos in transiciones.items():
+            x = simbolos.setdefault(simbolo, len(simbolos))
+            origen = estados.setdefault(estado, len(estados))
+            filas[(origen, x)] = {estados.setdefault(destino, len(estados)) for destino in destinos}
+        return cls._desde_filas(list(estados), list(simbolos), filas)
+
+    def a_transiciones(self):
+        """Diccionario {(simbolo, estado): {destinos}} con los nombres originales"""
+        estados = self.estados
+        transiciones = {}
+        for simbolo, desplazamientos, destinos in zip(self.simbolos, self.desplazamientos, self.destinos):
+            for origen in range(len(estados)):
+                inicio, fin = desplazamientos[origen], desplazamientos[origen + 1]
+                if inicio < fin:
+                    transiciones[(simbolo, estados[origen])] = {estados[d] for d in destinos[inicio:fin]}
+        return transiciones
+
+    def destinos_de(self, origen, x):
+        """Indices de los destinos del estado `origen` con el simbolo `x` (ambos indices)"""
+        desplazamientos = self.desplazamientos[x]
+        return self.destinos[x][desplazamientos[origen]:desplazamientos[origen + 1]]
+
+    def __len__(self):
+        return sum(len(destinos) for destinos in self.destinos)
+
+    def memoria(self):
+        """Bytes que ocupan los arreglos de transiciones"""
+        return sum(a.itemsize * len(a) for a in chain(self.desplazamientos, self.destinos))
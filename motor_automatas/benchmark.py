@@ -0,0 +1,55 @@
+"""Mediciones de rendimiento del motor: python -m motor_automatas.benchmark [--bits]"""
+import random
+import sys
+import time
+
+from .compilado import cargar_numpy
+from .conversion import AFNtoAFD, AFNtoAFDBits
+
+
+def generar_afn_prueba(n):
+    """AFN de (a|b)*a(a|b)^(n-1): su AFD tiene 2^n estados"""
+    estados = {f'q{i}' for i in range(n + 1)}
+    transiciones = {('a', 'q0'): {'q0', 'q1'}, ('b', 'q0'): {'q0'}}
+    for i in range(1, n):
+        transiciones[('a', f'q{i}')] = {f'q{i + 1}'}
+        transiciones[('b', f'q{i}')] = {f'q{i + 1}'}
+    return estados, {'a', 'b'}, transiciones, 'q0', {f'q{n}'}
+
+
+def benchmark_conversion(tamanos=range(8, 17), clase=AFNtoAFD):
+    """Mide el tiempo de convertir() contra el numero de estados del AFD producido"""
+    print(clase.__name__)
+    print(f"{'n':>3} {'estados AFD':>12} {'tiempo (s)':>11} {'us/estado':>10}")
+    for n in tamanos:
+        afn_to_afd = clase(*generar_afn_prueba(n))
+        inicio = time.perf_counter()
+        afn_to_afd.convertir()
+        transcurrido = time.perf_counter() - inicio
+        total = len(afn_to_afd.estados_afd)
+        print(f"{n:>3} {total:>12} {transcurrido:>11.4f} {transcurrido / total * 1e6:>10.2f}")
+
+
+def benchmark_evaluacion(n=10, total=1_000_000, longitud=12):
+    """Mide cuantas cadenas por segundo clasifica AFDCompilado.match_many"""
+    afn_to_afd = AFNtoAFD(*generar_afn_prueba(n))
+    afn_to_afd.convertir()
+    compilado = afn_to_afd.compilar()
+    generador = random.Random(0)
+    cadenas = [''.join(generador.choices('ab', k=longitud)) for _ in range(total)]
+    inicio = time.perf_counter()
+    aceptadas = sum(compilado.match_many(cadenas))
+    transcurrido = time.perf_counter() - inicio
+    print(f"{total} cadenas de {longitud} simbolos, {aceptadas} aceptadas: "
+          f"{transcurrido:.3f} s, {total / transcurrido:,.0f} cadenas/s")
+    if cargar_numpy() is not None:
+        inicio = time.perf_counter()
+        aceptadas = int(compilado.simular_lote(cadenas).sum())
+        transcurrido = time.perf_counter() - inicio
+        print(f"simular_lote (NumPy), {aceptadas} aceptadas: "
+              f"{transcurrido:.3f} s, {total / transcurrido:,.0f} cadenas/s")
+
+
+if __name__ == "__main__":
+    benchmark_conversion(clase=AFNtoAFDBits if '--bits' in sys.argv else AFNtoAFD)
+    benchmark_evaluacion()
@@ -0,0 +1,151 @@
+"""Cache en disco de conversiones AFN -> AFD, direccionada por contenido.
+
+Cada resultado se guarda en <carpeta>/<huella>.pickle, donde la huella es un
+SHA-256 de la forma canonica del AFN: el mismo automata da la misma huella
+aunque el archivo tenga otro orden, espacios o transiciones repetidas.
+"""
+import hashlib
+import os
+import pickle
+import tempfile
+from array import array
+
+# Se cambia cuando cambia lo que se guarda, para no leer entradas viejas
+VERSION_CACHE = 2
+
+
+def _rangos(nombres):
+    """Posicion de cada nombre en el orden alfabetico"""
+    rangos = [0] * len(nombres)
+    for rango, i in enumerate(sorted(range(len(nombres)), key=nombres.__getitem__)):
+        rangos[i] = rango
+    return rangos
+
+
+def _quitar_archivo(ruta):
+    try:
+        os.remove(ruta)
+    except OSError:  # ya no estaba, o no se puede borrar: se deja como esta
+        pass
+
+
+def huella_afn(afn, minimizar=True):
+    """SHA-256 (hex) de estados, alfabeto, transiciones, inicial y finales del AFN"""
+    estados = afn.estados
+    simbolos = afn.simbolos
+    h = hashlib.sha256(f'v{VERSION_CACHE} minimizar={bool(minimizar)}\n'.encode('utf-8'))
+    for nombres in (sorted(estados), sorted(simbolos), [afn.estado_inicial() or ''],
+                    sorted({estados[i] for i in afn.finales})):
+        h.update('\0'.join(nombres).encode('utf-8'))
+        h.update(b'\n')
+    # Cada transicion se reduce a un entero con los rangos alfabeticos de sus nombres,
+    # asi el orden del archivo y las repeticiones no cambian la huella
+    n = len(estados)
+    k = len(simbolos)
+    rangos_estados = _rangos(estados)
+    rangos_simbolos = _rangos(simbolos)
+    claves = sorted({(origen * k + x) * n + destino for origen, x, destino in zip(
+        map(rangos_estados.__getitem__, afn.origenes),
+        map(rangos_simbolos.__getitem__, afn.simbolos_transicion),
+        map(rangos_estados.__getitem__, afn.destinos))})
+    h.update(array('q', claves).tobytes())
+    return h.hexdigest()
+
+
+class CacheDisco:
+    """Resultados de preparar_afd guardados en una carpeta, con limite de bytes.
+
+    Al pasar tamano_maximo se borran los archivos usados hace mas tiempo (la
+    fecha de modificacion se actualiza en cada acierto).
+    """
+    def __init__(self, carpeta, tamano_maximo=64 * 1024 * 1024):
+        self.carpeta = carpeta
+        self.tamano_maximo = tamano_maximo
+        self.aciertos = 0
+        self.fallos = 0
+        self.descartes = 0
+        os.makedirs(carpeta, exist_ok=True)
+        # huella -> tamano en bytes, del usado hace mas tiempo al mas reciente
+        self.entradas = {}
+        archivos = []
+        for entrada in os.scandir(carpeta):
+            if entrada.is_file() and entrada.name.endswith('.pickle'):
+                info = entrada.stat()
+                archivos.append((info.st_mtime, entrada.name[:-len('.pickle')], info.st_size))
+        for _, huella, tamano in sorted(archivos):
+            self.entradas[huella] = tamano
+        self._recortar()
+
+    def _ruta(self, huella):
+        return os.path.join(self.carpeta, huella + '.pickle')
+
+    def obtener(self, huella):
+        if huella not in self.entradas:
+            self.fallos += 1
+            return None
+        ruta = self._ruta(huella)
+        try:
+            with open(ruta, 'rb') as f:
+                valor = pickle.load(f)
+            os.utime(ruta)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            # Borrado por otro proceso o a medio escribir: cuenta como fallo
+            self._borrar(huella)
+            self.fallos += 1
+            return None
+        self.entradas[huella] = self.entradas.pop(huella)
+        self.aciertos += 1
+        return valor
+
+    def guardar(self, huella, valor):
+        """Guarda valor con la huella; si no se puede escribir, simplemente no se guarda"""
+        datos = pickle.dumps(valor, protocol=pickle.HIGHEST_PROTOCOL)
+        if self.tamano_maximo is not None and len(datos) > self.tamano_maximo:
+            return
+        # Se escribe aparte y se renombra para que nadie lea un archivo a medias
+        temporal = None
+        try:
+            descriptor, temporal = tempfile.mkstemp(dir=self.carpeta, suffix='.tmp')
+            with os.fdopen(descriptor, 'wb') as f:
+                f.write(datos)
+            os.replace(temporal, self._ruta(huella))
+            temporal = None
+        except OSError:
+            # Carpeta borrada, disco lleno o sin permiso: el resultado no queda en
+            # la cache, pero la conversion ya hecha sigue valiendo
+            return
+        finally:
+            if temporal is not None:
+                _quitar_archivo(temporal)
+        self.entradas.pop(huella, None)
+        self.entradas[huella] = len(datos)
+        self._recortar()
+
+    def _borrar(self, huella):
+        self.entradas.pop(huella, None)
+        _quitar_archivo(self._ruta(huella))
+
+    def _recortar(self):
+        if self.tamano_maximo is None:
+            return
+        total = sum(self.entradas.values())
+        while total > self.tamano_maximo and self.entradas:
+            huella = next(iter(self.entradas))
+            total -= self.entradas[huella]
+            self._borrar(huella)
+            self.descartes += 1
+
+    def limpiar(self):
+        for huella in list(self.entradas):
+            self._borrar(huella)
+
+    def estadisticas(self):
+        consultas = self.aciertos + self.fallos
+        return {
+            'aciertos': self.aciertos,
+            'fallos': self.fallos,
+            'descartes': self.descartes,
+            'tamano': len(self.entradas),
+            'bytes': sum(self.entradas.values()),
+            'tasa_aciertos': self.aciertos / consultas if consultas else 0.0,
+        }
@@ -0,0 +1,602 @@
+"""AFD compilado a una tabla de transiciones densa para evaluar cadenas"""
+import mmap
+import os
+import struct
+import sys
+from array import array
+from itertools import chain
+
+# NumPy es opcional y tarda en importarse: se carga la primera vez que hace falta
+np = None
+_numpy_buscado = False
+
+
+def cargar_numpy():
+    """Devuelve el modulo numpy, o None si no esta instalado"""
+    global np, _numpy_buscado
+    if not _numpy_buscado:
+        _numpy_buscado = True
+        try:
+            import numpy
+        except ImportError:  # sin NumPy simular_lote usa match_many
+            numpy = None
+        np = numpy
+    return np
+
+
+# Formato binario de guardar()/cargar(), todo en little-endian:
+#   cabecera  MAGIA, version, estados n, simbolos k, estado inicial y largo en
+#             bytes de las tablas de simbolos y de nombres (relleno hasta 32)
+#   simbolos  UTF-8 separados por NUL
+#   nombres   UTF-8 separados por NUL, uno por estado
+#   tabla     n * k int32 alineados a 8 bytes, -1 sin transicion
+#   finales   mapa de bits de n bits, el bit i (LSB primero) es el estado i
+MAGIA = b'AFDC'
+VERSION_FORMATO = 1
+_CABECERA = struct.Struct('<4sHxxIIiII')
+_TAM_CABECERA = 32
+
+# Bytes del archivo que escanear_archivo revisa por vez con NumPy
+VENTANA_ESCANEO = 1 << 20
+# simular_lote termina en Python las cadenas largas cuando quedan estas o menos:
+# con tan pocas, cada paso de NumPy cuesta mas de lo que ahorra
+ACTIVAS_EN_PYTHON = 64
+
+
+def _alinear(posicion, multiplo=8):
+    return -(-posicion // multiplo) * multiplo
+
+
+def _nombre_estado(estado):
+    if isinstance(estado, (frozenset, set)):
+        return '{' + ', '.join(sorted(estado)) + '}' if estado else '∅'
+    return str(estado)
+
+
+class _TraduccionColumnas(dict):
+    """Tabla para str.translate: caracter -> columna, con una columna fija para los desconocidos"""
+    def __init__(self, columnas, desconocido):
+        super().__init__({ord(simbolo): columna for simbolo, columna in columnas.items()})
+        self.desconocido = desconocido
+
+    def __missing__(self, codigo):
+        return self.desconocido
+
+
+class ResultadoEscaneo:
+    """Coincidencias de escanear_archivo: pares (inicio, fin) en bytes, fin exclusivo"""
+    def __init__(self, coincidencias, lineas, conteo):
+        self.coincidencias = coincidencias
+        self.lineas = lineas
+        self.conteo = conteo
+
+    def __repr__(self):
+        return f"ResultadoEscaneo(lineas={self.lineas}, conteo={self.conteo})"
+
+
+class AFDCompilado:
+    """AFD como tabla de transiciones densa de enteros.
+
+    La fila i de `tabla` son los destinos del estado i, una columna por simbolo
+    segun `columnas`; `aceptacion[i]` vale 1 si el estado i es final.
+    """
+    def __init__(self, simbolos, tabla, aceptacion, estado_inicial=0, estados=None):
+        self.simbolos = list(simbolos)
+        self.columnas = {simbolo: i for i, simbolo in enumerate(self.simbolos)}
+        self.tabla = tabla
+        self.aceptacion = aceptacion
+        self.estado_inicial = estado_inicial
+        # Subconjunto del AFN que representa cada fila, si se conoce
+        self.estados = estados
+        # Tablas derivadas, armadas la primera vez que se necesitan (ver _tablas y _vista_numpy)
+        self._saltos = None
+        self._finales = None
+        self._inicio = None
+        self._tabla_plana = None
+        self._aceptacion_np = None
+        self._tabla_np = None
+        # Con simbolos de un caracter la cadena se traduce a columnas en C (str.translate)
+        self._traduccion = None
+        if len(self.simbolos) < 256 and all(len(simbolo) == 1 for simbolo in self.simbolos):
+            self._traduccion = _TraduccionColumnas(self.columnas, len(self.simbolos))
+
+    @classmethod
+    def desde_afd(cls, afd, estado_inicial, estados_finales, simbolos=None):
+        """Numera los estados de un afd {(estado, simbolo): destino} en orden BFS desde el inicial"""
+        if simbolos is None:
+            simbolos = sorted({simbolo for _, simbolo in afd})
+        indice = {estado_inicial: 0}
+        estados = [estado_inicial]
+        tabla = array('i')
+        for estado in estados:
+            for simbolo in simbolos:
+                destino = afd.get((estado, simbolo))
+                if destino is None:
+                    tabla.append(-1)
+                    continue
+                if destino not in indice:
+                    indice[destino] = len(estados)
+                    estados.append(destino)
+                tabla.append(indice[destino])
+        finales = set(estados_finales)
+        aceptacion = bytearray(1 if estado in finales else 0 for estado in estados)
+        return cls(simbolos, tabla, aceptacion, 0, estados)
+
+    def a_afd(self):
+        """Diccionario {(estado, simbolo): destino} como AFNtoAFD.afd.
+
+        Los estados son los subconjuntos de `estados` si se conocen, y si no el
+        numero de fila.
+        """
+        estados = self.estados if self.estados is not None else range(len(self.aceptacion))
+        k = len(self.simbolos)
+        afd = {}
+        for i, estado in enumerate(estados):
+            for simbolo, destino in zip(self.simbolos, self.tabla[i * k:(i + 1) * k]):
+                if destino >= 0:
+                    afd[(estado, simbolo)] = estados[destino]
+        return afd
+
+    def memoria(self):
+        """Bytes que ocupan la tabla y la aceptacion"""
+        return self.tabla.itemsize * len(self.tabla) + len(self.aceptacion)
+
+    def guardar(self, ruta, nombres=None):
+        """Escribe el AFD en el formato binario versionado (ver MAGIA).
+
+        `nombres` son las etiquetas de cada fila; por defecto se derivan de
+        `estados` (la composicion del subconjunto) o del numero de fila.
+        """
+        n = len(self.aceptacion)
+        k = len(self.simbolos)
+        if nombres is None:
+            nombres = map(_nombre_estado, self.estados) if self.estados is not None else map(str, range(n))
+        nombres = list(nombres)
+        if len(nombres) != n:
+            raise ValueError("hace falta un nombre por estado")
+        bloque_simbolos = '\0'.join(self.simbolos).encode('utf-8')
+        bloque_nombres = '\0'.join(nombres).encode('utf-8')
+
+        tabla = array('i', self.tabla.tolist())
+        if sys.byteorder == 'big':
+            tabla.byteswap()
+        finales = bytearray(-(-n // 8))
+        for i in range(n):
+            if self.aceptacion[i]:
+                finales[i >> 3] |= 1 << (i & 7)
+
+        with open(ruta, 'wb') as f:
+            f.write(_CABECERA.pack(MAGIA, VERSION_FORMATO, n, k, self.estado_inicial,
+                                   len(bloque_simbolos), len(bloque_nombres)).ljust(_TAM_CABECERA, b'\0'))
+            f.write(bloque_simbolos)
+            f.write(bloque_nombres)
+            posicion = _TAM_CABECERA + len(bloque_simbolos) + len(bloque_nombres)
+            f.write(bytes(_alinear(posicion) - posicion))
+            f.write(tabla.tobytes())
+            f.write(finales)
+
+    @classmethod
+    def cargar(cls, ruta):
+        """Abre un AFD guardado con guardar() mapeando el archivo en memoria.
+
+        Con NumPy la tabla es un frombuffer sobre el mmap, sin copia ni
+        lectura de texto; sin NumPy se usa un memoryview del mismo mapa. Los
+        recorridos con NumPy leen esa vista directamente; la tabla de saltos
+        de aceptar()/match_many se arma recien la primera vez que se usan.
+        """
+        with open(ruta, 'rb') as f:
+            mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if len(mapa) < _TAM_CABECERA:
+                raise ValueError(f"{ruta}: archivo demasiado corto para un AFD binario")
+            magia, version, n, k, estado_inicial, largo_simbolos, largo_nombres = _CABECERA.unpack_from(mapa)
+            if magia != MAGIA:
+                raise ValueError(f"{ruta}: no es un AFD binario")
+            if version != VERSION_FORMATO:
+                raise ValueError(f"{ruta}: version de formato {version} no soportada (se espera {VERSION_FORMATO})")
+
+            posicion = _TAM_CABECERA
+            simbolos = mapa[posicion:posicion + largo_simbolos].decode('utf-8').split('\0') if k else []
+            posicion += largo_simbolos
+            nombres = mapa[posicion:posicion + largo_nombres].decode('utf-8').split('\0') if n else []
+            inicio_tabla = _alinear(posicion + largo_nombres)
+            inicio_finales = inicio_tabla + 4 * n * k
+            if len(mapa) < inicio_finales + -(-n // 8):
+                raise ValueError(f"{ruta}: AFD binario incompleto")
+            if len(simbolos) != k or len(nombres) != n or not 0 <= estado_inicial < max(n, 1):
+                raise ValueError(f"{ruta}: cabecera del AFD binario inconsistente")
+        except ValueError:
+            # Nada apunta todavia al mapa: se cierra antes de avisar el error
+            mapa.close()
+            raise
+
+        if cargar_numpy() is not None:
+            tabla = np.frombuffer(mapa, dtype='<i4', count=n * k, offset=inicio_tabla)
+            bits = np.frombuffer(mapa, dtype=np.uint8, count=-(-n // 8), offset=inicio_finales)
+            aceptacion = np.unpackbits(bits, count=n, bitorder='little')
+        else:
+            if sys.byteorder == 'little':
+                tabla = memoryview(mapa)[inicio_tabla:inicio_finales].cast('i')
+            else:
+                tabla = array('i', mapa[inicio_tabla:inicio_finales])
+                tabla.byteswap()
+            aceptacion = bytearray((mapa[inicio_finales + (i >> 3)] >> (i & 7)) & 1 for i in range(n))
+        compilado = cls(simbolos, tabla, aceptacion, estado_inicial, nombres)
+        # El mapa sigue abierto mientras el AFD lo use
+        compilado._mapa = mapa
+        return compilado
+
+    def __len__(self):
+        return len(self.aceptacion)
+
+    def _tablas(self):
+        """(saltos, finales, inicio) para los recorridos en Python; se arman la primera vez.
+
+        saltos tiene una fila y una columna extra para el estado muerto y los
+        simbolos desconocidos, con los destinos ya multiplicados por el ancho de fila.
+        """
+        if self._saltos is None:
+            self._preparar()
+        return self._saltos, self._finales, self._inicio
+
+    def _preparar(self):
+        n = len(self.aceptacion)
+        k = len(self.simbolos)
+        ancho = k + 1
+        muerto = n * ancho
+        if np is not None and isinstance(self.tabla, np.ndarray):
+            # Tabla cargada de un archivo binario: se arma de una vez con NumPy
+            relleno = np.full((n + 1, ancho), muerto, dtype=np.int64)
+            relleno[:n, :k] = np.where(self.tabla >= 0, self.tabla.astype(np.int64) * ancho, muerto).reshape(n, k)
+            saltos = relleno.ravel().tolist()
+        else:
+            tabla = self.tabla.tolist()
+            saltos = []
+            for i in range(n):
+                fila = tabla[i * k:(i + 1) * k]
+                saltos.extend(destino * ancho if destino >= 0 else muerto for destino in fila)
+                saltos.append(muerto)
+            saltos.extend([muerto] * ancho)
+        self._finales = bytearray(len(saltos))
+        self._finales[:muerto:ancho] = bytes(self.aceptacion)
+        self._inicio = self.estado_inicial * ancho
+        self._saltos = saltos
+
+    def _vista_numpy(self):
+        """(tabla, aceptacion) para los recorridos con NumPy.
+
+        tabla es self.tabla vista como int32 plano, sin copiarla (con -1 donde no
+        hay transicion); aceptacion trae un False extra al final, asi el estado
+        muerto -1 se puede usar como indice.
+        """
+        if cargar_numpy() is None:
+            raise ImportError("esta operacion de AFDCompilado necesita NumPy")
+        if self._aceptacion_np is None:
+            n = len(self.aceptacion)
+            if isinstance(self.tabla, np.ndarray):
+                tabla = self.tabla.reshape(-1)
+            elif len(self.tabla):
+                tabla = np.frombuffer(self.tabla, dtype=np.int32)
+            else:
+                tabla = np.zeros(0, dtype=np.int32)
+            aceptacion = np.zeros(n + 1, dtype=bool)
+            if n:
+                finales = self.aceptacion if isinstance(self.aceptacion, np.ndarray) else \
+                    np.frombuffer(self.aceptacion, dtype=np.uint8)
+                aceptacion[:n] = finales == 1
+            self._tabla_plana = tabla
+            self._aceptacion_np = aceptacion
+        return self._tabla_plana, self._aceptacion_np
+
+    def _paso_numpy(self, tabla, estados, columnas):
+        """Destino de cada estado con su columna sobre la tabla plana. -1 es el estado
+        muerto; un simbolo desconocido (columna k) tambien lleva a el."""
+        k = len(self.simbolos)
+        if not len(tabla):
+            return np.full(len(estados), -1, dtype=np.int32)
+        vivos = (estados >= 0) & (columnas < k)
+        destinos = tabla[np.where(vivos, estados.astype(np.intp) * k + columnas, 0)]
+        return np.where(vivos, destinos, np.int32(-1))
+
+    def _codificar(self, cadena):
+        if self._traduccion is not None and isinstance(cadena, str):
+            return cadena.translate(self._traduccion).encode('latin-1')
+        desconocido = len(self.simbolos)
+        return [self.columnas.get(simbolo, desconocido) for simbolo in cadena]
+
+    def estado_final(self, cadena):
+        """Estado alcanzado tras leer la cadena, o -1 si cae en el estado muerto"""
+        saltos, _, e = self._tablas()
+        for c in self._codificar(cadena):
+            e = saltos[e + c]
+        ancho = len(self.simbolos) + 1
+        return e // ancho if e < len(self.aceptacion) * ancho else -1
+
+    def aceptar(self, cadena):
+        saltos, finales, e = self._tablas()
+        for c in self._codificar(cadena):
+            e = saltos[e + c]
+        return finales[e] == 1
+
+    def match_many(self, cadenas):
+        """Lista de booleanos: si el AFD acepta cada cadena"""
+        saltos, finales, inicio = self._tablas()
+        codificar = self._codificar
+        traduccion = self._traduccion
+        resultado = []
+        agregar = resultado.append
+        for cadena in cadenas:
+            e = inicio
+            if traduccion is not None and cadena.__class__ is str:
+                codigos = cadena.translate(traduccion).encode('latin-1')
+            else:
+                codigos = codificar(cadena)
+            for c in codigos:
+                e = saltos[e + c]
+            agregar(finales[e] == 1)
+        return resultado
+
+    def _tabla_bytes(self):
+        """Tabla de 256 bytes para bytes.translate: byte -> columna (la ultima para los desconocidos)"""
+        k = len(self.simbolos)
+        if self._traduccion is None or any(ord(simbolo) > 255 for simbolo in self.simbolos):
+            raise ValueError("la lectura por bytes requiere simbolos de un solo byte (latin-1)")
+        tabla = bytearray([k]) * 256
+        for simbolo, columna in self.columnas.items():
+            tabla[ord(simbolo)] = columna
+        return bytes(tabla)
+
+    def _bloques(self, fuente, tam_bloque):
+        if hasattr(fuente, 'read'):
+            while True:
+                bloque = fuente.read(tam_bloque)
+                if not bloque:
+                    return
+                yield bloque
+        else:
+            for bloque in fuente:
+                yield bloque.encode('latin-1') if isinstance(bloque, str) else bloque
+
+    def buscar_en_flujo(self, fuente, tam_bloque=1 << 16, separador=b'\n'):
+        """Generador con el desplazamiento (en bytes) de cada registro aceptado.
+
+        `fuente` es un archivo binario (se lee en bloques de tam_bloque) o un
+        iterador de bloques; los registros estan separados por `separador` y
+        pueden quedar partidos entre bloques, por eso el estado del AFD se
+        arrastra de un bloque al siguiente. La memoria no depende del tamaño
+        de la entrada.
+        """
+        if len(separador) != 1:
+            raise ValueError("el separador debe ser un solo byte")
+        traduccion = self._tabla_bytes()
+        saltos, finales, inicio = self._tablas()
+        e = inicio
+        desplazamiento = 0
+        inicio_registro = 0
+        for bloque in self._bloques(fuente, tam_bloque):
+            codigos = memoryview(bloque.translate(traduccion))
+            pos = 0
+            while True:
+                fin = bloque.find(separador, pos)
+                for c in codigos[pos:fin if fin >= 0 else len(bloque)]:
+                    e = saltos[e + c]
+                if fin < 0:
+                    break
+                if finales[e]:
+                    yield inicio_registro
+                e = inicio
+                pos = fin + 1
+                inicio_registro = desplazamiento + pos
+            desplazamiento += len(bloque)
+        # Ultimo registro sin separador al final
+        if inicio_registro < desplazamiento and finales[e]:
+            yield inicio_registro
+
+    def escanear_archivo(self, ruta, modo='lineas', separador=b'\n', guardar_posiciones=True):
+        """Recorre un archivo mapeado en memoria con la tabla compilada, sin copiarlo a str.
+
+        modo='lineas' cuenta las lineas completas aceptadas; modo='prefijos'
+        reporta cada prefijo aceptado desde el inicio de cada linea. Con NumPy
+        el archivo se ve con frombuffer (sin copia) y todas las lineas avanzan
+        a la vez; sin NumPy se recorre un memoryview byte a byte.
+        """
+        if modo not in ('lineas', 'prefijos'):
+            raise ValueError(f"modo desconocido: {modo}")
+        if len(separador) != 1:
+            raise ValueError("el separador debe ser un solo byte")
+        traduccion = self._tabla_bytes()
+        with open(ruta, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return ResultadoEscaneo([], 0, 0)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+                if cargar_numpy() is not None:
+                    return self._escanear_numpy(mapa, modo, separador, traduccion, guardar_posiciones)
+                return self._escanear_memoryview(mapa, modo, separador, traduccion, guardar_posiciones)
+
+    def _escanear_memoryview(self, mapa, modo, separador, traduccion, guardar_posiciones):
+        saltos, finales, inicio = self._tablas()
+        muerto = len(self.aceptacion) * (len(self.simbolos) + 1)
+        prefijos = modo == 'prefijos'
+        vista = memoryview(mapa)
+        total = len(mapa)
+        coincidencias = []
+        conteo = 0
+        lineas = 0
+        pos = 0
+        while pos < total:
+            fin = mapa.find(separador, pos)
+            if fin < 0:
+                fin = total
+            lineas += 1
+            e = inicio
+            if prefijos and finales[e]:
+                conteo += 1
+                if guardar_posiciones:
+                    coincidencias.append((pos, pos))
+            for i, byte in enumerate(vista[pos:fin], pos + 1):
+                e = saltos[e + traduccion[byte]]
+                if e == muerto:
+                    break
+                if prefijos and finales[e]:
+                    conteo += 1
+                    if guardar_posiciones:
+                        coincidencias.append((pos, i))
+            if not prefijos and finales[e]:
+                conteo += 1
+                if guardar_posiciones:
+                    coincidencias.append((pos, fin))
+            pos = fin + 1
+        vista.release()
+        return ResultadoEscaneo(coincidencias, lineas, conteo)
+
+    def _escanear_numpy(self, mapa, modo, separador, traduccion, guardar_posiciones, ventana=VENTANA_ESCANEO):
+        """Recorre el mapa por ventanas de `ventana` bytes: los separadores se buscan
+        solo dentro de la ventana y la linea que queda abierta pasa a la siguiente,
+        asi la memoria extra depende de la ventana y no del tamano del archivo"""
+        datos = np.frombuffer(mapa, dtype=np.uint8)
+        byte = separador[0]
+        total = len(datos)
+        coincidencias = []
+        conteo = 0
+        lineas = 0
+        pos = 0
+        while pos < total:
+            fin_ventana = min(pos + ventana, total)
+            separadores = np.flatnonzero(datos[pos:fin_ventana] == byte)
+            while not separadores.size and fin_ventana < total:
+                # Linea mas larga que la ventana: se sigue buscando su final
+                siguiente = min(fin_ventana + ventana, total)
+                separadores = np.flatnonzero(datos[fin_ventana:siguiente] == byte) + (fin_ventana - pos)
+                fin_ventana = siguiente
+            fines = separadores + pos
+            if fin_ventana == total and (not fines.size or fines[-1] != total - 1):
+                fines = np.append(fines, total)  # ultima linea sin separador al final
+            inicios = np.concatenate(([pos], fines[:-1] + 1))
+            conteo_ventana, encontradas = self._escanear_lineas_numpy(
+                datos, inicios, fines, traduccion, modo == 'prefijos', guardar_posiciones)
+            conteo += conteo_ventana
+            lineas += len(inicios)
+            coincidencias.extend(encontradas)
+            pos = int(fines[-1]) + 1
+        del datos
+        return ResultadoEscaneo(coincidencias, lineas, conteo)
+
+    def _escanear_lineas_numpy(self, datos, inicios, fines, traduccion, prefijos, guardar_posiciones):
+        """Avanza a la vez todas las lineas datos[inicios[i]:fines[i]]; devuelve (conteo, coincidencias)"""
+        columnas = np.frombuffer(traduccion, dtype=np.uint8)
+        tabla, aceptacion = self._vista_numpy()
+        longitudes = fines - inicios
+
+        encontrados = []
+        conteo = 0
+        if prefijos and aceptacion[self.estado_inicial]:
+            conteo += len(inicios)
+            encontrados.append((inicios, inicios))
+        activas = np.arange(len(inicios))
+        estados = np.full(len(inicios), self.estado_inicial, dtype=np.int32)
+        ultimos = estados.copy()
+        j = 0
+        while activas.size:
+            # Se descartan las lineas terminadas y las que ya cayeron al estado muerto
+            vivas = (longitudes[activas] > j) & (estados >= 0)
+            activas = activas[vivas]
+            estados = estados[vivas]
+            if not activas.size:
+                break
+            estados = self._paso_numpy(tabla, estados, columnas[datos[inicios[activas] + j]])
+            ultimos[activas] = estados
+            j += 1
+            if prefijos:
+                aceptadas = activas[aceptacion[estados]]
+                conteo += len(aceptadas)
+                if guardar_posiciones and aceptadas.size:
+                    encontrados.append((inicios[aceptadas], inicios[aceptadas] + j))
+        if not prefijos:
+            aceptadas = np.flatnonzero(aceptacion[ultimos])
+            conteo = len(aceptadas)
+            encontrados = [(inicios[aceptadas], fines[aceptadas])]
+
+        if not guardar_posiciones or not encontrados:
+            return conteo, []
+        desde = np.concatenate([d for d, _ in encontrados])
+        hasta = np.concatenate([h for _, h in encontrados])
+        orden = np.lexsort((hasta, desde))
+        return conteo, list(zip(desde[orden].tolist(), hasta[orden].tolist()))
+
+    def tabla_numpy(self):
+        """Matriz (estados + 1) x (simbolos + 1) de NumPy; la ultima fila y columna son el estado muerto.
+
+        Es una copia de la tabla; simular_lote y escanear_archivo no la usan.
+        """
+        if self._tabla_np is None:
+            tabla, _ = self._vista_numpy()
+            n = len(self.aceptacion)
+            k = len(self.simbolos)
+            self._tabla_np = np.full((n + 1, k + 1), n, dtype=np.int32)
+            self._tabla_np[:n, :k] = np.where(tabla >= 0, tabla, n).reshape(n, k)
+        return self._tabla_np
+
+    def simular_lote(self, cadenas, tam_lote=1 << 16):
+        """Evalua muchas cadenas a la vez avanzando todas una posicion por paso.
+
+        Cada paso es una indexacion de NumPy sobre la tabla sin copiar (ver _paso_numpy),
+        asi que el bucle de Python recorre posiciones y no caracteres. Devuelve un
+        arreglo booleano; sin NumPy cae a match_many y devuelve una lista.
+        """
+        if cargar_numpy() is None:
+            return self.match_many(cadenas)
+        cadenas = list(cadenas)
+        tabla, aceptacion = self._vista_numpy()
+        resultado = np.zeros(len(cadenas), dtype=bool)
+        for inicio in range(0, len(cadenas), tam_lote):
+            lote = cadenas[inicio:inicio + tam_lote]
+            resultado[inicio:inicio + len(lote)] = self._simular_lote(lote, tabla, aceptacion)
+        return resultado
+
+    def _simular_lote(self, cadenas, tabla, aceptacion):
+        total = len(cadenas)
+        texto = None
+        if self._traduccion is not None:
+            try:
+                texto = ''.join(cadenas)
+            except TypeError:  # el lote trae secuencias de simbolos, no str
+                pass
+        if texto is not None:
+            # Una sola traduccion de todo el lote: cada caracter ocupa exactamente un byte
+            longitudes = np.fromiter(map(len, cadenas), dtype=np.intp, count=total)
+            codigos = np.frombuffer(texto.translate(self._traduccion).encode('latin-1'), dtype=np.uint8)
+        else:
+            codificadas = [self._codificar(cadena) for cadena in cadenas]
+            longitudes = np.fromiter(map(len, codificadas), dtype=np.intp, count=total)
+            codigos = np.fromiter(chain.from_iterable(codificadas), dtype=np.int32)
+        maximo = int(longitudes.max()) if total else 0
+
+        # Ordenar por longitud descendente: en el paso j solo siguen activas las
+        # primeras `activas[j]` cadenas, y su simbolo j se lee de `codigos` con su
+        # inicio. La memoria queda proporcional al lote, sin una matriz
+        # (cadena mas larga) x (cadenas) llena de relleno
+        orden = np.argsort(-longitudes, kind='stable')
+        posicion = np.empty(total, dtype=np.intp)
+        posicion[orden] = np.arange(total)
+        inicios = (np.cumsum(longitudes) - longitudes)[orden]
+        activas = total - np.cumsum(np.bincount(longitudes, minlength=maximo + 1))
+
+        estados = np.full(total, self.estado_inicial, dtype=np.int32)
+        for j in range(maximo):
+            m = activas[j]
+            if m <= ACTIVAS_EN_PYTHON:
+                finales = inicios[:m] + longitudes[orden[:m]]
+                for i in range(m):
+                    estados[i] = self._terminar_cadena(tabla, int(estados[i]), codigos[inicios[i] + j:finales[i]])
+                break
+            estados[:m] = self._paso_numpy(tabla, estados[:m], codigos[inicios[:m] + j])
+        return aceptacion[estados][posicion]
+
+    def _terminar_cadena(self, tabla, estado, codigos):
+        """Sigue una cadena desde `estado` con los codigos que le faltan, sobre la tabla plana"""
+        k = len(self.simbolos)
+        for c in codigos.tolist():
+            if estado < 0 or c >= k:
+                return -1
+            estado = int(tabla[estado * k + c])
+        return estado
@@ -0,0 +1,428 @@
+"""Conversion de AFN a AFD por construccion de subconjuntos"""
+from collections import OrderedDict, defaultdict, deque
+
+from .afn import AFNCompacto
+from .compilado import AFDCompilado
+from .minimizacion import minimizar_afd
+
+
+# Cada cuantos subconjuntos procesados convertir() avisa el progreso y revisa si se cancelo
+AVISO_CADA = 256
+
+
+class ConversionCancelada(Exception):
+    """convertir() se detuvo porque se activo el evento `cancelar`"""
+
+
+def _avisar(progreso, cancelar, descubiertos, pendientes):
+    if cancelar is not None and cancelar.is_set():
+        raise ConversionCancelada(f"conversion cancelada con {descubiertos} estados del AFD")
+    if progreso is not None:
+        progreso(descubiertos, pendientes)
+
+
+class CacheLRU:
+    """Diccionario acotado que descarta la entrada usada hace mas tiempo.
+
+    tamano_maximo=None no pone limite y tamano_maximo=0 desactiva la cache.
+    """
+    def __init__(self, tamano_maximo=None):
+        self.tamano_maximo = tamano_maximo
+        self.datos = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+        self.descartes = 0
+
+    def obtener(self, clave):
+        valor = self.datos.get(clave)
+        if valor is None:
+            self.fallos += 1
+            return None
+        self.datos.move_to_end(clave)
+        self.aciertos += 1
+        return valor
+
+    def guardar(self, clave, valor):
+        if self.tamano_maximo == 0:
+            return
+        self.datos[clave] = valor
+        self.datos.move_to_end(clave)
+        if self.tamano_maximo is not None and len(self.datos) > self.tamano_maximo:
+            self.datos.popitem(last=False)
+            self.descartes += 1
+
+    def limpiar(self):
+        self.datos.clear()
+
+    def estadisticas(self):
+        consultas = self.aciertos + self.fallos
+        return {
+            'aciertos': self.aciertos,
+            'fallos': self.fallos,
+            'descartes': self.descartes,
+            'tamano': len(self.datos),
+            'tasa_aciertos': self.aciertos / consultas if consultas else 0.0,
+        }
+
+
+# Tope por defecto de la cache por estado: de sobra para |Q|*|Z| entradas en los AFN usuales
+TAM_CACHE_ESTADOS = 1 << 16
+
+
+class AFNtoAFD:
+    def __init__(self, estados, alfabeto, transiciones, estado_inicial, estados_finales,
+                 tam_cache_estados=TAM_CACHE_ESTADOS, tam_cache_subconjuntos=0):
+        self.estados = estados
+        self.alfabeto = alfabeto
+        self.transiciones = transiciones
+        self.estado_inicial = estado_inicial
+        self.estados_finales = estados_finales
+        self.afd = {}
+        self.cerraduras = self._precalcular_cerraduras()
+        # (estado del AFN, simbolo) -> cerradura_e(mueve({estado}, simbolo))
+        self.cache_estados = CacheLRU(tam_cache_estados)
+        # (subconjunto, simbolo) -> cerradura_e(mueve(subconjunto, simbolo)). convertir()
+        # calcula cada (T, x) una sola vez, asi que ahi nunca acierta y viene apagada;
+        # sirve a quien llame mueve_cerrado muchas veces con los mismos subconjuntos
+        self.cache_subconjuntos = CacheLRU(tam_cache_subconjuntos)
+
+    @classmethod
+    def desde_afn(cls, afn, **opciones):
+        """Crea el conversor a partir de un AFN de leer_afn, sin pasar por cadenas"""
+        estados = afn.estados
+        simbolos = afn.simbolos
+        # Una sola pasada por las columnas del AFN, ya con nombres
+        transiciones = {}
+        claves = zip(map(simbolos.__getitem__, afn.simbolos_transicion), map(estados.__getitem__, afn.origenes))
+        for clave, destino in zip(claves, map(estados.__getitem__, afn.destinos)):
+            destinos = transiciones.get(clave)
+            if destinos is None:
+                transiciones[clave] = {destino}
+            else:
+                destinos.add(destino)
+        return cls({estados[origen] for origen in set(afn.origenes)},
+                   {simbolos[x] for x in set(afn.simbolos_transicion)} - {'e'},
+                   transiciones,
+                   afn.estado_inicial(),
+                   {estados[i] for i in afn.finales},
+                   **opciones)
+
+    def _precalcular_cerraduras(self):
+        """Cerradura-e de cada estado del AFN en una sola pasada (condensacion de Tarjan de las aristas 'e')"""
+        sucesores = {estado: destinos for (simbolo, estado), destinos in self.transiciones.items() if simbolo == 'e'}
+        cerraduras = {}
+        indices = {}
+        bajo = {}
+        pila = []
+        en_pila = set()
+
+        for raiz in sucesores:
+            if raiz in indices:
+                continue
+            indices[raiz] = bajo[raiz] = len(indices)
+            pila.append(raiz)
+            en_pila.add(raiz)
+            trabajo = [(raiz, iter(sucesores[raiz]))]
+            while trabajo:
+                v, hijos = trabajo[-1]
+                for w in hijos:
+                    if w not in indices:
+                        indices[w] = bajo[w] = len(indices)
+                        pila.append(w)
+                        en_pila.add(w)
+                        trabajo.append((w, iter(sucesores.get(w, ()))))
+                        break
+                    if w in en_pila:
+                        bajo[v] = min(bajo[v], indices[w])
+                else:
+                    trabajo.pop()
+                    if trabajo:
+                        padre = trabajo[-1][0]
+                        bajo[padre] = min(bajo[padre], bajo[v])
+                    if bajo[v] != indices[v]:
+                        continue
+                    # v es raiz de una componente: sus sucesoras ya tienen su cerradura calculada
+                    componente = []
+                    while True:
+                        w = pila.pop()
+                        en_pila.discard(w)
+                        componente.append(w)
+                        if w == v:
+                            break
+                    cerradura = set(componente)
+                    for w in componente:
+                        for destino in sucesores.get(w, ()):
+                            if destino in cerraduras:
+                                cerradura.update(cerraduras[destino])
+                    cerradura = frozenset(cerradura)
+                    for w in componente:
+                        cerraduras[w] = cerradura
+        return cerraduras
+
+    def cerradura_e(self, estados):
+        cerradura = set()
+        for estado in estados:
+            if estado in self.cerraduras:
+                cerradura.update(self.cerraduras[estado])
+            else:
+                cerradura.add(estado)
+        return frozenset(cerradura)
+
+    def mueve(self, estados, simbolo):
+        resultado = set()
+        for estado in estados:
+            if (simbolo, estado) in self.transiciones:
+                resultado.update(self.transiciones[(simbolo, estado)])
+        return resultado
+
+    def mueve_cerrado(self, estados, simbolo):
+        """cerradura_e(mueve(estados, simbolo)) armada con los resultados cacheados de cada estado"""
+        usar_cache = self.cache_subconjuntos.tamano_maximo != 0
+        if usar_cache:
+            U = self.cache_subconjuntos.obtener((estados, simbolo))
+            if U is not None:
+                return U
+        cerradura = set()
+        for estado in estados:
+            destino = self.cache_estados.obtener((estado, simbolo))
+            if destino is None:
+                destino = self.cerradura_e(self.transiciones.get((simbolo, estado), ()))
+                self.cache_estados.guardar((estado, simbolo), destino)
+            cerradura.update(destino)
+        U = frozenset(cerradura)
+        if usar_cache:
+            self.cache_subconjuntos.guardar((estados, simbolo), U)
+        return U
+
+    def estadisticas_cache(self):
+        return {
+            'estados': self.cache_estados.estadisticas(),
+            'subconjuntos': self.cache_subconjuntos.estadisticas(),
+        }
+
+    def _cambios(self, anterior):
+        """Lo que cambio respecto del AFN de `anterior`: {simbolo: estados con otras
+        transiciones con ese simbolo} y el conjunto de estados con otra cerradura-e"""
+        cambiados = defaultdict(set)
+        for clave in self.transiciones.keys() | anterior.transiciones.keys():
+            if self.transiciones.get(clave) != anterior.transiciones.get(clave):
+                simbolo, estado = clave
+                cambiados[simbolo].add(estado)
+        cerraduras_cambiadas = set()
+        for estado in self.cerraduras.keys() | anterior.cerraduras.keys():
+            propia = frozenset((estado,))
+            if self.cerraduras.get(estado, propia) != anterior.cerraduras.get(estado, propia):
+                cerraduras_cambiadas.add(estado)
+        return cambiados, cerraduras_cambiadas
+
+    def convertir(self, anterior=None, progreso=None, cancelar=None):
+        """Construccion de subconjuntos; devuelve {(subconjunto, simbolo): subconjunto}.
+
+        Con `anterior` (otro conversor ya convertido, p. ej. el de la version previa
+        del mismo automata) cada transicion (T, x) -> U de su AFD se reutiliza si
+        ningun estado de T cambio sus transiciones con x y ningun estado de U
+        cambio su cerradura-e; solo las demas se vuelven a calcular.
+
+        progreso(estados descubiertos, subconjuntos por procesar) se llama cada
+        AVISO_CADA subconjuntos; si el threading.Event `cancelar` esta activo se
+        lanza ConversionCancelada.
+        """
+        T0 = self.cerradura_e({self.estado_inicial})
+        simbolos = sorted(x for x in self.alfabeto if x != 'e')
+        afd_anterior = getattr(anterior, 'afd_subconjuntos', None) or {}
+        cambiados, cerraduras_cambiadas = self._cambios(anterior) if afd_anterior else ({}, set())
+        self.transiciones_reutilizadas = 0
+        # Indice hash subconjunto -> id del AFD y cola FIFO: cada estado nuevo
+        # cuesta O(1) en lugar de recorrer la lista de estados ya descubiertos
+        self.indice_afd = {T0: 0}
+        self.estados_afd = [T0]
+        self.estado_inicial_afd = T0
+        self.afd = {}
+        estados_sin_marcar = deque([T0])
+        estado_sumidero = frozenset()
+        procesados = 0
+
+        while estados_sin_marcar:
+            T = estados_sin_marcar.popleft()
+            procesados += 1
+            if procesados % AVISO_CADA == 0:
+                _avisar(progreso, cancelar, len(self.estados_afd), len(estados_sin_marcar))
+            for x in simbolos:
+                U = afd_anterior.get((T, x))
+                if U is not None and T.isdisjoint(cambiados.get(x, ())) and cerraduras_cambiadas.isdisjoint(U):
+                    self.transiciones_reutilizadas += 1
+                else:
+                    U = self.mueve_cerrado(T, x)
+                if U not in self.indice_afd:
+                    self.indice_afd[U] = len(self.estados_afd)
+                    self.estados_afd.append(U)
+                    if U != estado_sumidero:
+                        estados_sin_marcar.append(U)
+                self.afd[(T, x)] = U
+
+        if estado_sumidero in self.indice_afd:
+            for x in simbolos:
+                self.afd[(estado_sumidero, x)] = estado_sumidero
+
+        # minimizar() reemplaza self.afd; este queda para convertir(anterior=...)
+        self.afd_subconjuntos = self.afd
+        _avisar(progreso, None, len(self.estados_afd), 0)
+        return self.afd
+
+    def obtener_estados_finales_afd(self):
+        estados_finales_afd = []
+        for estado_afd in set(estado for estado, _ in self.afd.keys()):
+            if any(estado in self.estados_finales for estado in estado_afd):
+                estados_finales_afd.append(estado_afd)
+        return estados_finales_afd
+
+    def minimizar(self):
+        """Reemplaza el AFD producido por convertir() por su version minima"""
+        self.afd, _, self.estado_inicial_afd = minimizar_afd(
+            self.afd, self.obtener_estados_finales_afd(), self.estado_inicial_afd)
+        # Reconstruir el orden de descubrimiento sobre el AFD minimo
+        simbolos = sorted(x for x in self.alfabeto if x != 'e')
+        self.estados_afd = [self.estado_inicial_afd]
+        self.indice_afd = {self.estado_inicial_afd: 0}
+        for T in self.estados_afd:
+            for x in simbolos:
+                U = self.afd.get((T, x))
+                if U is not None and U not in self.indice_afd:
+                    self.indice_afd[U] = len(self.estados_afd)
+                    self.estados_afd.append(U)
+        return self.afd
+
+    def compilar(self):
+        """Tabla de transiciones densa lista para evaluar cadenas (ver AFDCompilado)"""
+        simbolos = sorted(x for x in self.alfabeto if x != 'e')
+        return AFDCompilado.desde_afd(self.afd, self.estado_inicial_afd,
+                                      self.obtener_estados_finales_afd(), simbolos)
+
+    def compactar(self):
+        """Transiciones del AFN en arreglos CSR (ver AFNCompacto)"""
+        return AFNCompacto.desde_transiciones(self.transiciones)
+
+
+class AFNtoAFDBits(AFNtoAFD):
+    """Misma interfaz que AFNtoAFD, pero representa cada subconjunto como una mascara de bits (int)"""
+    def __init__(self, estados, alfabeto, transiciones, estado_inicial, estados_finales,
+                 tam_cache_estados=TAM_CACHE_ESTADOS, tam_cache_subconjuntos=0):
+        super().__init__(estados, alfabeto, transiciones, estado_inicial, estados_finales,
+                         tam_cache_estados, tam_cache_subconjuntos)
+        # Los destinos pueden nombrar estados que no aparecen como origen
+        nombres = set(estados) | {estado_inicial}
+        for (_, estado), destinos in transiciones.items():
+            nombres.add(estado)
+            nombres.update(destinos)
+        self.nombres = sorted(nombres)
+        self.indice = {nombre: i for i, nombre in enumerate(self.nombres)}
+
+        # Para cada simbolo, la mascara de destinos de cada estado del AFN
+        self.transiciones_bits = defaultdict(lambda: [0] * len(self.nombres))
+        for (simbolo, estado), destinos in transiciones.items():
+            self.transiciones_bits[simbolo][self.indice[estado]] |= self.a_mascara(destinos)
+
+        self.cerraduras_bits = [self.a_mascara(self.cerraduras.get(nombre, (nombre,))) for nombre in self.nombres]
+        self.mueve_cerrado_estado = {}
+        self.afd_bits = {}
+
+    def a_mascara(self, estados):
+        mascara = 0
+        for estado in estados:
+            mascara |= 1 << self.indice[estado]
+        return mascara
+
+    def a_conjunto(self, mascara):
+        estados = []
+        while mascara:
+            bit = mascara & -mascara
+            estados.append(self.nombres[bit.bit_length() - 1])
+            mascara ^= bit
+        return frozenset(estados)
+
+    def cerradura_bits(self, mascara):
+        cerradura = 0
+        while mascara:
+            bit = mascara & -mascara
+            cerradura |= self.cerraduras_bits[bit.bit_length() - 1]
+            mascara ^= bit
+        return cerradura
+
+    def mueve_bits(self, mascara, simbolo):
+        if simbolo not in self.transiciones_bits:
+            return 0
+        fila = self.transiciones_bits[simbolo]
+        resultado = 0
+        while mascara:
+            bit = mascara & -mascara
+            resultado |= fila[bit.bit_length() - 1]
+            mascara ^= bit
+        return resultado
+
+    def mueve_cerrado_bits(self, mascara, simbolo):
+        if self.cache_subconjuntos.tamano_maximo == 0:
+            return self.paso_bits(mascara, simbolo)
+        clave = (mascara, simbolo)
+        U = self.cache_subconjuntos.obtener(clave)
+        if U is None:
+            U = self.paso_bits(mascara, simbolo)
+            self.cache_subconjuntos.guardar(clave, U)
+        return U
+
+    def paso_bits(self, mascara, simbolo):
+        """cerradura_e(mueve(mascara, simbolo)) sin pasar por la cache de subconjuntos"""
+        # Con mascaras la tabla por estado ya es tan compacta (n enteros por simbolo)
+        # que se guarda completa en lugar de pasar por la LRU de estados
+        if simbolo not in self.mueve_cerrado_estado:
+            self.mueve_cerrado_estado[simbolo] = [
+                self.cerradura_bits(destinos) for destinos in self.transiciones_bits.get(simbolo, ())
+            ]
+        fila = self.mueve_cerrado_estado[simbolo]
+        U = 0
+        resto = mascara if fila else 0
+        while resto:
+            bit = resto & -resto
+            U |= fila[bit.bit_length() - 1]
+            resto ^= bit
+        return U
+
+    def convertir(self, anterior=None, progreso=None, cancelar=None):
+        if anterior is not None:
+            # El AFD anterior esta en subconjuntos: la reutilizacion va por el camino de AFNtoAFD
+            self.afd_bits = {}
+            return super().convertir(anterior, progreso, cancelar)
+        T0 = self.cerradura_bits(1 << self.indice[self.estado_inicial])
+        simbolos = sorted(x for x in self.alfabeto if x != 'e')
+        indice_bits = {T0: 0}
+        orden = [T0]
+        self.afd_bits = {}
+        estados_sin_marcar = deque([T0])
+        procesados = 0
+
+        while estados_sin_marcar:
+            T = estados_sin_marcar.popleft()
+            procesados += 1
+            if procesados % AVISO_CADA == 0:
+                _avisar(progreso, cancelar, len(orden), len(estados_sin_marcar))
+            for x in simbolos:
+                U = self.mueve_cerrado_bits(T, x)
+                if U not in indice_bits:
+                    indice_bits[U] = len(orden)
+                    orden.append(U)
+                    if U:
+                        estados_sin_marcar.append(U)
+                self.afd_bits[(T, x)] = U
+
+        if 0 in indice_bits:
+            for x in simbolos:
+                self.afd_bits[(0, x)] = 0
+
+        # Decodificar cada subconjunto una sola vez para exponer el mismo afd que AFNtoAFD
+        conjuntos = {mascara: self.a_conjunto(mascara) for mascara in orden}
+        self.estados_afd = [conjuntos[mascara] for mascara in orden]
+        self.indice_afd = {conjunto: i for i, conjunto in enumerate(self.estados_afd)}
+        self.estado_inicial_afd = conjuntos[T0]
+        self.afd = {(conjuntos[T], x): conjuntos[U] for (T, x), U in self.afd_bits.items()}
+        self.afd_subconjuntos = self.afd
+        _avisar(progreso, None, len(orden), 0)
+        return self.afd
@@ -0,0 +1,136 @@
+"""Lectura de archivos de automatas con lineas Q=, Z=, i=, A= y w="""
+import mmap
+import os
+import re
+
+from .afn import AFN
+
+# El texto se recorre una sola vez: se busca el siguiente encabezado de linea
+# (Q=, Z=, i=, A=, w=) y el resto de esa linea se tokeniza con la expresion que le
+# corresponde. Llaves, comas, punto y coma y espacios se saltan sin copiarse; cualquier
+# otro caracter que no forme un nombre o una transicion cae en el grupo `error`.
+_CLAVE = re.compile(rb'^[ \t]*([QZiAw])[ \t]*=', re.MULTILINE)
+_NOMBRE = re.compile(rb'[\s,;{}]*(?:([^,;(){}=\s]+)|(?P<error>[^\s,;{}]))')
+_TRANSICION = re.compile(
+    rb'[\s,;{}]*(?:\([ \t]*([^,;(){}\s]+)[ \t]*,[ \t]*([^,;(){}\s]+)[ \t]*,[ \t]*([^,;(){}\s]+)[ \t]*\)'
+    rb'|(?P<error>[^\s,;{}]))')
+
+
+def _error_sintaxis(texto, posicion, que):
+    """ValueError con la linea y la columna (desde 1) de `posicion` en el texto"""
+    # Solo en el error: mmap no tiene count(), la rebanada si
+    linea = texto[:posicion].count(b'\n') + 1
+    columna = posicion - (texto.rfind(b'\n', 0, posicion) + 1) + 1
+    fin = texto.find(b'\n', posicion)
+    resto = bytes(texto[posicion:fin if fin >= 0 else len(texto)])[:20].decode('utf-8', 'replace').rstrip()
+    return ValueError(f"linea {linea}, columna {columna}: se esperaba {que} y se encontro {resto!r}")
+
+
+def leer_afn(texto):
+    """Convierte el texto (str, bytes o mmap) en un AFN numerado, en una sola pasada"""
+    if isinstance(texto, str):
+        texto = texto.encode('utf-8')
+    afn = AFN()
+    # Cada nombre se decodifica una sola vez; despues se busca por sus bytes
+    estados = {}
+    simbolos = {}
+
+    def estado(nombre):
+        i = estados.get(nombre)
+        if i is None:
+            i = estados[nombre] = afn.agregar_estado(nombre.decode('utf-8'))
+        return i
+
+    def simbolo(nombre):
+        i = simbolos.get(nombre)
+        if i is None:
+            i = simbolos[nombre] = afn.agregar_simbolo(nombre.decode('utf-8'))
+        return i
+
+    total = len(texto)
+    encabezado = _CLAVE.search(texto)
+    while encabezado is not None:
+        clave = encabezado.group(1)
+        inicio = encabezado.end()
+        fin = texto.find(b'\n', inicio)
+        if fin < 0:
+            fin = total
+
+        if clave == b'w':
+            origenes = afn.origenes
+            simbolos_transicion = afn.simbolos_transicion
+            destinos = afn.destinos
+            for transicion in _TRANSICION.finditer(texto, inicio, fin):
+                if transicion.lastgroup == 'error':
+                    raise _error_sintaxis(texto, transicion.start('error'), "una transicion (origen,simbolo,destino)")
+                origen, x, destino, _ = transicion.groups()
+                i = estados.get(origen)
+                origenes.append(estado(origen) if i is None else i)
+                i = simbolos.get(x)
+                simbolos_transicion.append(simbolo(x) if i is None else i)
+                i = estados.get(destino)
+                destinos.append(estado(destino) if i is None else i)
+        else:
+            nombres = []
+            for token in _NOMBRE.finditer(texto, inicio, fin):
+                if token.lastgroup == 'error':
+                    raise _error_sintaxis(texto, token.start('error'), "un nombre")
+                nombres.append(token.group(1))
+            if clave == b'Q':
+                for nombre in nombres:
+                    estado(nombre)
+                afn.declarados_q = len(afn.estados)
+            elif clave == b'Z':
+                for nombre in nombres:
+                    simbolo(nombre)
+                afn.declarados_z = len(afn.simbolos)
+            elif clave == b'i':
+                if nombres:
+                    afn.inicial = estado(nombres[0])
+            else:
+                afn.finales.extend(estado(nombre) for nombre in nombres)
+        encabezado = _CLAVE.search(texto, fin)
+    return afn
+
+
+def leer_afn_archivo(ruta):
+    """leer_afn sobre el archivo mapeado en memoria, sin cargarlo como str"""
+    with open(ruta, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:  # mmap no acepta longitud 0
+            return AFN()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+            return leer_afn(mapa)
+
+
+def a_datos_automata(afn):
+    """Diccionario datos_automata que usa la interfaz, a partir de un AFN"""
+    return {
+        'estados_q': afn.estados[:afn.declarados_q],
+        'simbolos_z': afn.simbolos[:afn.declarados_z],
+        'estado_inicial': afn.estado_inicial(),
+        'estados_finales_a': [afn.estados[i] for i in afn.finales],
+        'afn': afn,
+        'estados_finales_afd': set()
+    }
+
+
+def leer_automata(lines):
+    """Devuelve el diccionario datos_automata que usa la interfaz"""
+    return a_datos_automata(leer_afn(''.join(lines)))
+
+
+def leer_archivo(ruta):
+    return a_datos_automata(leer_afn_archivo(ruta))
+
+
+def formatear_automata(estados, simbolos, estado_inicial, estados_finales, transiciones):
+    """Texto en el mismo formato Q=/Z=/i=/A=/w= que lee leer_automata.
+
+    transiciones es una lista de (origen, simbolo, destino).
+    """
+    w = ';'.join(f'({origen},{simbolo},{destino})' for origen, simbolo, destino in transiciones)
+    return (f"Q={{{','.join(estados)}}}\n"
+            f"Z={{{','.join(simbolos)}}}\n"
+            f"i={estado_inicial}\n"
+            f"A={{{','.join(estados_finales)}}}\n"
+            f"w={{{w}}}\n")
@@ -0,0 +1,176 @@
+"""Conversion por lotes de archivos de automatas usando todos los nucleos.
+
+    python -m motor_automatas ENTRADA [ENTRADA ...] [-j N] [-o CARPETA] [--sin-minimizar] [--binario]
+                                [--nombres {letras,numeros}] [--perfil]
+
+Cada ENTRADA puede ser una carpeta (se toman sus *.txt), un patron glob o un
+archivo. Por cada automata se escribe CARPETA/<nombre>.afd.txt con el AFD en
+el mismo formato Q=/Z=/i=/A=/w=; con --binario tambien CARPETA/<nombre>.afd.bin,
+que AFDCompilado.cargar abre sin volver a convertir. Los estados del AFD se
+nombran en el orden en que se descubren desde el inicial, como en la interfaz.
+Con --perfil (o --profile) se muestra donde se fue el tiempo de cada archivo.
+Si dos entradas se llaman igual (d1/x.txt y d2/x.txt), las salidas conservan
+las carpetas a partir de la carpeta comun: CARPETA/d1/x.afd.txt y CARPETA/d2/x.afd.txt.
+"""
+import argparse
+import glob
+import os
+import sys
+import textwrap
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+
+from .lector import formatear_automata, leer_afn_archivo
+from .perfil import Perfil, fase
+from .presentacion import ESQUEMAS_NOMBRES, convertir_afn, mapear_estados
+
+
+def expandir_entradas(entradas):
+    rutas = []
+    for entrada in entradas:
+        if os.path.isdir(entrada):
+            rutas.extend(sorted(glob.glob(os.path.join(entrada, '*.txt'))))
+        elif os.path.isfile(entrada):
+            rutas.append(entrada)
+        else:
+            rutas.extend(sorted(glob.glob(entrada)))
+    # Sin repetidos, conservando el orden
+    return list(dict.fromkeys(rutas))
+
+
+def nombres_salida(rutas):
+    """Nombre de salida (sin .afd.txt) de cada ruta: el del archivo sin extension o, si
+    dos entradas se llaman igual, su ruta relativa a la carpeta comun. ValueError si aun
+    asi dos entradas irian al mismo archivo."""
+    nombres = [os.path.splitext(os.path.basename(ruta))[0] for ruta in rutas]
+    if len(set(nombres)) < len(nombres):
+        absolutas = [os.path.abspath(ruta) for ruta in rutas]
+        base = os.path.commonpath([os.path.dirname(ruta) for ruta in absolutas])
+        nombres = [os.path.splitext(os.path.relpath(ruta, base))[0] for ruta in absolutas]
+    repetidos = sorted(nombre for nombre, veces in Counter(nombres).items() if veces > 1)
+    if repetidos:
+        raise ValueError("varias entradas se escribirian en el mismo archivo: "
+                         + ', '.join(nombre + '.afd.txt' for nombre in repetidos))
+    return nombres
+
+
+def _entero_positivo(texto):
+    valor = int(texto)
+    if valor < 1:
+        raise argparse.ArgumentTypeError(f"debe ser al menos 1: {valor}")
+    return valor
+
+
+def convertir_archivo(ruta, carpeta_salida, minimizar=True, binario=False, nombres=None, perfilar=False,
+                      nombre_salida=None):
+    """Lee, convierte y escribe un automata. Devuelve (ruta, estados del AFD, segundos, error, perfil),
+    donde perfil es el Perfil de la conversion si se pidio perfilar y None si no.
+
+    nombre_salida (por defecto el nombre del archivo sin extension) puede incluir carpetas.
+    """
+    inicio = time.perf_counter()
+    perfil = Perfil() if perfilar else None
+    try:
+        with perfil or nullcontext():
+            with fase(perfil, 'lectura'):
+                afn = leer_afn_archivo(ruta)
+            afn_to_afd = convertir_afn(afn, minimizar=minimizar, perfil=perfil)
+            afd = afn_to_afd.afd
+            with fase(perfil, 'nombres'):
+                # Mismo orden y nombres que la tabla del AFD en la interfaz
+                simbolos = sorted(afn_to_afd.alfabeto - {'e'})
+                estados_afd = afn_to_afd.estados_afd
+                mapeo = mapear_estados(estados_afd, nombres)
+            with fase(perfil, 'escritura'):
+                texto = formatear_automata(
+                    [mapeo[estado] for estado in estados_afd],
+                    simbolos,
+                    mapeo[afn_to_afd.estado_inicial_afd],
+                    sorted(mapeo[estado] for estado in afn_to_afd.obtener_estados_finales_afd()),
+                    [(mapeo[estado], x, mapeo[afd[(estado, x)]])
+                     for estado in estados_afd for x in simbolos if (estado, x) in afd],
+                )
+                if nombre_salida is None:
+                    nombre_salida = os.path.splitext(os.path.basename(ruta))[0]
+                destino = os.path.join(carpeta_salida, nombre_salida)
+                os.makedirs(os.path.dirname(destino), exist_ok=True)
+                with open(destino + '.afd.txt', 'w') as f:
+                    f.write(texto)
+                if binario:
+                    compilado = afn_to_afd.compilar()
+                    compilado.guardar(destino + '.afd.bin',
+                                      [mapeo[estado] for estado in compilado.estados])
+    except Exception as error:  # un archivo mal formado no detiene el lote
+        return ruta, 0, time.perf_counter() - inicio, f'{type(error).__name__}: {error}', perfil
+    return ruta, len(afn_to_afd.estados_afd), time.perf_counter() - inicio, None, perfil
+
+
+def convertir_lote(rutas, carpeta_salida, trabajadores=None, minimizar=True, binario=False,
+                   nombres=None, perfilar=False):
+    """Convierte las rutas en paralelo y va devolviendo los resultados de convertir_archivo.
+
+    Cada ruta va a su propio archivo de salida (ver nombres_salida).
+    """
+    salidas = nombres_salida(rutas)
+    os.makedirs(carpeta_salida, exist_ok=True)
+    if trabajadores == 1:
+        for ruta, salida in zip(rutas, salidas):
+            yield convertir_archivo(ruta, carpeta_salida, minimizar, binario, nombres, perfilar, salida)
+        return
+    with ProcessPoolExecutor(max_workers=trabajadores) as ejecutor:
+        yield from ejecutor.map(convertir_archivo, rutas, [carpeta_salida] * len(rutas),
+                                [minimizar] * len(rutas), [binario] * len(rutas), [nombres] * len(rutas),
+                                [perfilar] * len(rutas), salidas,
+                                chunksize=max(1, len(rutas) // 64))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m motor_automatas',
+                                     description='Convierte por lotes archivos de AFN a AFD')
+    parser.add_argument('entradas', nargs='+', help='carpetas, patrones glob o archivos .txt')
+    parser.add_argument('-j', '--trabajadores', type=_entero_positivo, default=os.cpu_count(),
+                        help='procesos en paralelo (por defecto, uno por nucleo)')
+    parser.add_argument('-o', '--salida', default='afd_convertidos', help='carpeta de resultados')
+    parser.add_argument('--sin-minimizar', action='store_true', help='escribir el AFD sin minimizar')
+    parser.add_argument('--binario', action='store_true',
+                        help='escribir tambien el AFD en formato binario (.afd.bin)')
+    parser.add_argument('--nombres', choices=sorted(ESQUEMAS_NOMBRES),
+                        help='nombrar los estados del AFD con letras (A..Z, AA..) o numeros '
+                             '(por defecto, como en la interfaz)')
+    parser.add_argument('--perfil', '--profile', action='store_true',
+                        help='mostrar por archivo el tiempo de cada fase, las llamadas a cerradura_e '
+                             'y mueve, los estados del AFD y el pico de memoria')
+    args = parser.parse_args(argv)
+
+    rutas = expandir_entradas(args.entradas)
+    if not rutas:
+        print("Error: no se encontraron archivos de automatas", file=sys.stderr)
+        return 1
+    try:
+        nombres_salida(rutas)
+    except ValueError as error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 1
+
+    inicio = time.perf_counter()
+    total_estados = 0
+    fallidos = 0
+    for ruta, estados_afd, _, error, perfil in convertir_lote(rutas, args.salida, args.trabajadores,
+                                                              not args.sin_minimizar, args.binario,
+                                                              args.nombres, args.perfil):
+        if error:
+            fallidos += 1
+            print(f"Error en {ruta}: {error}", file=sys.stderr)
+        if perfil is not None:
+            print(f"{ruta}:")
+            print(textwrap.indent(perfil.resumen(), '  '))
+        total_estados += estados_afd
+    transcurrido = time.perf_counter() - inicio
+
+    convertidos = len(rutas) - fallidos
+    print(f"{convertidos} automatas convertidos ({fallidos} con error) en {transcurrido:.2f} s "
+          f"con {args.trabajadores} procesos: {convertidos / transcurrido:.1f} automatas/s, "
+          f"{total_estados / transcurrido:,.0f} estados AFD/s")
+    return 1 if fallidos else 0
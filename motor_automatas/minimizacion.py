@@ -0,0 +1,59 @@
+"""Minimizacion de AFD (Hopcroft)"""
+from collections import defaultdict
+
+
+def minimizar_afd(afd, estados_finales, estado_inicial):
+    """Minimiza un AFD completo con el refinamiento de particiones de Hopcroft, O(n·|Σ|·log n).
+
+    Cada clase de estados equivalentes se representa con la union de sus
+    subconjuntos del AFN, asi el resultado conserva la forma de convertir() y se
+    puede pasar tal cual a mapear_estados. Devuelve (afd, estados_finales, estado_inicial).
+    """
+    estados = list({origen for origen, _ in afd} | set(afd.values()) | {estado_inicial})
+    simbolos = sorted({simbolo for _, simbolo in afd})
+    indice = {estado: i for i, estado in enumerate(estados)}
+    n = len(estados)
+
+    inversas = {x: [[] for _ in range(n)] for x in simbolos}
+    for (origen, x), destino in afd.items():
+        inversas[x][indice[destino]].append(indice[origen])
+
+    finales = {indice[estado] for estado in estados_finales if estado in indice}
+    bloques = [bloque for bloque in (finales, set(range(n)) - finales) if bloque]
+    bloque_de = [0] * n
+    for b, bloque in enumerate(bloques):
+        for i in bloque:
+            bloque_de[i] = b
+    # Basta con refinar contra el bloque mas pequeño de la particion inicial
+    pendientes = {min(range(len(bloques)), key=lambda b: len(bloques[b]))} if len(bloques) == 2 else set()
+
+    while pendientes:
+        divisor = list(bloques[pendientes.pop()])
+        for x in simbolos:
+            predecesores = defaultdict(set)
+            for i in divisor:
+                for j in inversas[x][i]:
+                    predecesores[bloque_de[j]].add(j)
+            for b, interseccion in predecesores.items():
+                if len(interseccion) == len(bloques[b]):
+                    continue
+                bloques[b] -= interseccion
+                nuevo = len(bloques)
+                bloques.append(interseccion)
+                for j in interseccion:
+                    bloque_de[j] = nuevo
+                if b in pendientes or len(interseccion) <= len(bloques[b]):
+                    pendientes.add(nuevo)
+                else:
+                    pendientes.add(b)
+
+    etiquetas = [frozenset().union(*(estados[i] for i in bloque)) for bloque in bloques]
+    afd_minimo = {}
+    for bloque, etiqueta in zip(bloques, etiquetas):
+        representante = estados[next(iter(bloque))]
+        for x in simbolos:
+            destino = afd.get((representante, x))
+            if destino is not None:
+                afd_minimo[(etiqueta, x)] = etiquetas[bloque_de[indice[destino]]]
+    finales_minimos = [etiquetas[b] for b, bloque in enumerate(bloques) if next(iter(bloque)) in finales]
+    return afd_minimo, finales_minimos, etiquetas[bloque_de[indice[estado_inicial]]]
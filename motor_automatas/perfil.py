@@ -0,0 +1,142 @@
+"""Mediciones de una conversion: tiempo por fase, llamadas a cerradura_e y
+mueve, subconjunto mas grande, estados del AFD y pico de memoria.
+
+    perfil = Perfil()
+    with perfil:
+        with perfil.fase('lectura'):
+            afn = leer_afn_archivo(ruta)
+        resultado = preparar_afd(afn, perfil=perfil)
+    print(perfil.resumen())
+
+Las funciones que reciben perfil=None no miden nada ni pagan nada por ello.
+"""
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+# Metodos de AFNtoAFD y AFNtoAFDBits cuyas llamadas se cuentan (los que no tenga el conversor se ignoran)
+METODOS_CONTADOS = ('cerradura_e', 'mueve', 'mueve_cerrado',
+                    'cerradura_bits', 'mueve_bits', 'mueve_cerrado_bits', 'paso_bits')
+
+
+def _contador(llamadas, nombre, metodo):
+    def contado(*args):
+        llamadas[nombre] += 1
+        return metodo(*args)
+    return contado
+
+
+class Perfil:
+    """Estadisticas de una conversion; se usa como `with perfil:` para medir la memoria.
+
+    fases: {nombre: segundos}, en el orden en que se midieron por primera vez.
+    llamadas: {metodo del conversor: veces que se llamo}.
+    subconjunto_maximo: estados del AFN en el subconjunto mas grande.
+    estados_afd / estados_minimos: estados antes y despues de minimizar (None si no se minimizo).
+    memoria_pico: bytes (tracemalloc) entre la entrada y la salida del with.
+
+    tracemalloc hace mas lenta cada reserva de memoria; con medir_memoria=False
+    los tiempos de las fases se parecen mas a los de una conversion sin perfil.
+    """
+    def __init__(self, medir_memoria=True):
+        self.medir_memoria = medir_memoria
+        self.fases = {}
+        self.llamadas = {}
+        self.subconjunto_maximo = 0
+        self.estados_afd = 0
+        self.estados_minimos = None
+        self.memoria_pico = None
+        self._detener_tracemalloc = False
+
+    def __enter__(self):
+        if self.medir_memoria:
+            if tracemalloc.is_tracing():
+                tracemalloc.reset_peak()
+            else:
+                tracemalloc.start()
+                self._detener_tracemalloc = True
+        return self
+
+    def __exit__(self, *excepcion):
+        if self.medir_memoria and tracemalloc.is_tracing():
+            self.memoria_pico = tracemalloc.get_traced_memory()[1]
+            if self._detener_tracemalloc:
+                tracemalloc.stop()
+                self._detener_tracemalloc = False
+        return False
+
+    @contextmanager
+    def fase(self, nombre):
+        """Suma al tiempo de la fase `nombre` lo que tarda el bloque"""
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.fases[nombre] = self.fases.get(nombre, 0.0) + time.perf_counter() - inicio
+
+    @contextmanager
+    def contar_llamadas(self, conversor):
+        """Cuenta las llamadas a METODOS_CONTADOS del conversor mientras dura el bloque.
+
+        Tapa los metodos con envoltorios en la instancia y los quita al salir,
+        asi que fuera del bloque el conversor queda igual que antes.
+        """
+        tapados = []
+        for nombre in METODOS_CONTADOS:
+            metodo = getattr(conversor, nombre, None)
+            if metodo is not None and nombre not in vars(conversor):
+                self.llamadas.setdefault(nombre, 0)
+                setattr(conversor, nombre, _contador(self.llamadas, nombre, metodo))
+                tapados.append(nombre)
+        try:
+            yield
+        finally:
+            for nombre in tapados:
+                delattr(conversor, nombre)
+
+    def registrar_subconjuntos(self, estados_afd):
+        """Toma el numero de estados y el subconjunto mas grande de la construccion de subconjuntos"""
+        self.estados_afd = len(estados_afd)
+        self.subconjunto_maximo = max(map(len, estados_afd), default=0)
+
+    def total(self):
+        return sum(self.fases.values())
+
+    def como_dict(self):
+        return {
+            'fases': dict(self.fases),
+            'total': self.total(),
+            'llamadas': dict(self.llamadas),
+            'subconjunto_maximo': self.subconjunto_maximo,
+            'estados_afd': self.estados_afd,
+            'estados_minimos': self.estados_minimos,
+            'memoria_pico': self.memoria_pico,
+        }
+
+    def resumen(self):
+        """Texto de varias lineas: una por fase con su porcentaje, y luego los contadores"""
+        total = self.total()
+        ancho = max(map(len, self.fases), default=0)
+        lineas = [f"{nombre:<{ancho}} {segundos:9.4f} s {segundos / total if total else 0.0:6.1%}"
+                  for nombre, segundos in self.fases.items()]
+        lineas.append(f"{'total':<{ancho}} {total:9.4f} s")
+        llamadas = ', '.join(f"{nombre}: {veces:,}" for nombre, veces in self.llamadas.items() if veces)
+        if llamadas:
+            lineas.append(f"llamadas: {llamadas}")
+        estados = f"estados AFD: {self.estados_afd:,}"
+        if self.estados_minimos is not None:
+            estados += f" ({self.estados_minimos:,} al minimizar)"
+        lineas.append(f"{estados}, subconjunto mas grande: {self.subconjunto_maximo:,} estados del AFN")
+        if self.memoria_pico is not None:
+            lineas.append(f"pico de memoria: {self.memoria_pico / 1024 / 1024:.1f} MB")
+        return '\n'.join(lineas)
+
+
+def fase(perfil, nombre):
+    """perfil.fase(nombre), o un bloque que no mide nada si perfil es None"""
+    return perfil.fase(nombre) if perfil is not None else nullcontext()
+
+
+def contar_llamadas(perfil, conversor):
+    """perfil.contar_llamadas(conversor), o nada si perfil es None"""
+    return perfil.contar_llamadas(conversor) if perfil is not None else nullcontext()
@@ -0,0 +1,201 @@
+"""Preparacion de lo que la interfaz dibuja en las tablas del AFN y del AFD"""
+import string
+from itertools import count, product
+
+from .cache import huella_afn
+from .conversion import AFNtoAFD, ConversionCancelada
+from .perfil import contar_llamadas, fase
+
+
+def nombres_letras():
+    """A, B, ..., Z, AA, AB, ... (base 26 biyectiva), sin limite"""
+    for largo in count(1):
+        for letras in product(string.ascii_uppercase, repeat=largo):
+            yield ''.join(letras)
+
+
+def nombres_numeros():
+    """1, 2, 3, ..."""
+    return map(str, count(1))
+
+
+ESQUEMAS_NOMBRES = {'letras': nombres_letras, 'numeros': nombres_numeros}
+
+
+def esquema_nombres(estados_afd):
+    """'numeros' si cada estado es un solo estado del AFN con nombre de letras
+    (asi no se confunden), 'letras' en cualquier otro caso"""
+    for estado in estados_afd:
+        if len(estado) != 1:
+            return 'letras'
+        for miembro in estado:
+            if any(not c.isalpha() for c in miembro if c.strip()):
+                return 'letras'
+    return 'numeros'
+
+
+def mapear_estados(estados_afd, esquema=None):
+    """Nombre corto de cada estado, en el orden de estados_afd.
+
+    esquema es 'letras' o 'numeros'; sin esquema se elige con esquema_nombres.
+    """
+    if esquema is None:
+        esquema = esquema_nombres(estados_afd)
+    if esquema not in ESQUEMAS_NOMBRES:
+        raise ValueError(f"esquema de nombres desconocido: {esquema!r}")
+    return dict(zip(estados_afd, ESQUEMAS_NOMBRES[esquema]()))
+
+
+def construir_conversor(afn, clase_conversor=AFNtoAFD):
+    """Conversor para un AFN de leer_afn"""
+    if afn.estado_inicial() is None:
+        raise ValueError("el automata no tiene estado inicial ni transiciones")
+    return clase_conversor.desde_afn(afn)
+
+
+def convertir_afn(afn, clase_conversor=AFNtoAFD, minimizar=True, anterior=None,
+                  progreso=None, cancelar=None, perfil=None):
+    """Conversor con el AFD ya construido (y minimizado si se pide).
+
+    `anterior` es el conversor de una version previa del automata: se pasa a
+    convertir() para reutilizar las transiciones del AFD que no cambiaron.
+    progreso y cancelar se pasan tal cual a convertir(). Con un Perfil se miden
+    las fases preparacion, conversion y minimizacion.
+    """
+    with fase(perfil, 'preparacion'):
+        afn_to_afd = construir_conversor(afn, clase_conversor)
+    with fase(perfil, 'conversion'), contar_llamadas(perfil, afn_to_afd):
+        afn_to_afd.convertir(anterior, progreso, cancelar)
+    if perfil is not None:
+        perfil.registrar_subconjuntos(afn_to_afd.estados_afd)
+    if cancelar is not None and cancelar.is_set():
+        raise ConversionCancelada("conversion cancelada antes de minimizar")
+    if minimizar:
+        with fase(perfil, 'minimizacion'):
+            afn_to_afd.minimizar()
+        if perfil is not None:
+            perfil.estados_minimos = len(afn_to_afd.estados_afd)
+    return afn_to_afd
+
+
+def presentar_afd(afn_to_afd, perfil=None):
+    """(afd, estados_afd, simbolos, estados_finales_afd, mapeo) de un conversor ya convertido"""
+    with fase(perfil, 'nombres'):
+        afd = afn_to_afd.afd
+        estados_finales_afd = afn_to_afd.obtener_estados_finales_afd()
+
+        simbolos = sorted(afn_to_afd.alfabeto - {'e'})
+        # convertir() y minimizar() ya dejan los estados en el orden en que se
+        # descubren desde el inicial: el inicial recibe el primer nombre
+        estados_afd = afn_to_afd.estados_afd
+        mapeo = mapear_estados(estados_afd)
+    return afd, estados_afd, simbolos, estados_finales_afd, mapeo
+
+
+def preparar_afd(afn, clase_conversor=AFNtoAFD, minimizar=True, cache=None, anterior=None, perfil=None):
+    """Convierte el AFN y devuelve (afd, estados_afd, simbolos, estados_finales_afd, mapeo).
+
+    estados_afd viene en el orden en que se descubren desde el inicial (el de la
+    tabla) y mapeo asigna a cada subconjunto el nombre corto de la columna Estado. Con una CacheDisco, un AFN
+    ya convertido se lee de disco en lugar de convertirse otra vez. Con un Perfil
+    (ver perfil.py) se mide cada fase, incluida la consulta a la cache.
+    """
+    return preparar_afd_conversor(afn, clase_conversor, minimizar, cache, anterior, perfil=perfil)[0]
+
+
+def preparar_afd_conversor(afn, clase_conversor=AFNtoAFD, minimizar=True, cache=None, anterior=None,
+                           progreso=None, cancelar=None, perfil=None):
+    """Como preparar_afd, pero devuelve (resultado, conversor) para convertir por partes.
+
+    conversor es el que hay que pasar como `anterior` en la siguiente llamada:
+    el de esta conversion, o el mismo `anterior` si el resultado salio de la cache.
+    progreso y cancelar se pasan a convertir_afn.
+    """
+    if cache is not None:
+        with fase(perfil, 'cache'):
+            huella = huella_afn(afn, minimizar)
+            resultado = cache.obtener(huella)
+        if resultado is not None:
+            return resultado, anterior
+    afn_to_afd = convertir_afn(afn, clase_conversor, minimizar, anterior, progreso, cancelar, perfil)
+    resultado = presentar_afd(afn_to_afd, perfil)
+    if cache is not None:
+        with fase(perfil, 'cache'):
+            cache.guardar(huella, resultado)
+    return resultado, afn_to_afd
+
+
+def etiqueta_composicion(estado):
+    """Texto de la columna Composicion: '{a, b}' o '∅' para el estado sumidero"""
+    return '{' + ', '.join(sorted(estado)) + '}' if estado else '∅'
+
+
+class ModeloTabla:
+    """Tabla ya formateada: nombres de columna, filas de texto y el ancho en
+    caracteres del valor mas largo de cada columna"""
+    def __init__(self, columnas, anchos, filas):
+        self.columnas = columnas
+        self.anchos = anchos
+        self.filas = filas
+
+
+class ModeloAFD(ModeloTabla):
+    """ModeloTabla del AFD con los nombres cortos de sus estados y de sus finales"""
+    def __init__(self, columnas, anchos, filas, nombres, simbolos, finales, mapeo, inverso):
+        super().__init__(columnas, anchos, filas)
+        self.nombres = nombres
+        self.simbolos = simbolos
+        self.finales = finales
+        self.mapeo = mapeo
+        # nombre corto -> subconjunto
+        self.inverso = inverso
+
+
+def _medir(fila, anchos):
+    for i, valor in enumerate(fila):
+        if len(valor) > anchos[i]:
+            anchos[i] = len(valor)
+
+
+def modelo_afn(afn):
+    """Tabla del AFN: una fila por estado con transiciones y una columna por simbolo"""
+    estados = afn.estados
+    simbolos = afn.simbolos
+    celdas = {clave: ', '.join(estados[d] for d in destinos) for clave, destinos in afn.agrupar().items()}
+    origenes = sorted({origen for origen, _ in celdas}, key=estados.__getitem__)
+    columnas = sorted({x for _, x in celdas}, key=simbolos.__getitem__)
+
+    anchos = [0] * (len(columnas) + 1)
+    filas = []
+    for origen in origenes:
+        fila = [estados[origen]]
+        fila.extend(celdas.get((origen, x), '') for x in columnas)
+        _medir(fila, anchos)
+        filas.append(fila)
+    if not filas:
+        anchos = [5] * len(anchos)
+    return ModeloTabla(['Estado'] + [simbolos[x] for x in columnas], anchos, filas)
+
+
+def modelo_afd(resultado):
+    """Tabla del AFD a partir de lo que devuelve preparar_afd; cada etiqueta se arma una vez"""
+    afd, estados_afd, simbolos, estados_finales_afd, mapeo = resultado
+    anchos = [0] * (len(simbolos) + 2)
+    filas = []
+    nombres = []
+    inverso = {}
+    for estado in estados_afd:
+        nombre = mapeo[estado]
+        inverso[nombre] = estado
+        fila = [etiqueta_composicion(estado), nombre]
+        for simbolo in simbolos:
+            destino = afd.get((estado, simbolo))
+            fila.append(mapeo[destino] if destino is not None else '')
+        _medir(fila, anchos)
+        filas.append(fila)
+        nombres.append(nombre)
+    if not filas:
+        anchos = [10, 5] + [5] * len(simbolos)
+    finales = sorted(mapeo[estado] for estado in estados_finales_afd if estado in mapeo)
+    return ModeloAFD(['Composicion', 'Estado'] + simbolos, anchos, filas, nombres, simbolos, finales,
+                     mapeo, inverso)
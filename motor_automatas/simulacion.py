@@ -0,0 +1,82 @@
+"""Simulacion directa del AFN, sin determinizarlo completo"""
+from .afn import AFN
+from .conversion import AFNtoAFD, AFNtoAFDBits
+from .presentacion import construir_conversor
+
+
+class SimuladorAFN:
+    """Evalua cadenas directamente sobre el AFN, sin construir el AFD completo.
+
+    Lleva el conjunto de estados activos como mascara de bits y en cada simbolo
+    aplica cerradura_e(mueve(...)) de AFNtoAFDBits. Con perezoso=True guarda las
+    transiciones de los subconjuntos que las cadenas van visitando (un AFD
+    perezoso); si se superan max_estados se vacia y se vuelve a llenar, asi la
+    memoria queda acotada por lo que recorren las entradas.
+
+    automata puede ser un AFNtoAFDBits, que se usa tal cual, o un AFNtoAFD o un
+    AFN de leer_afn, con los que se arma un AFNtoAFDBits (no hace falta convertir).
+    """
+    def __init__(self, automata, perezoso=False, max_estados=10000):
+        self.afn_to_afd = afn_to_afd = _conversor_bits(automata)
+        self.perezoso = perezoso
+        self.max_estados = max_estados
+        self.inicial = afn_to_afd.cerradura_bits(1 << afn_to_afd.indice[afn_to_afd.estado_inicial])
+        self.finales = afn_to_afd.a_mascara(e for e in afn_to_afd.estados_finales if e in afn_to_afd.indice)
+        self.simbolos = {x for x in afn_to_afd.alfabeto if x != 'e'}
+        # mascara -> {simbolo: mascara}, solo para los subconjuntos visitados
+        self.afd_perezoso = {}
+        self.vaciados = 0
+
+    def _paso(self, mascara, simbolo):
+        if simbolo not in self.simbolos:
+            return 0
+        if not self.perezoso:
+            return self.afn_to_afd.paso_bits(mascara, simbolo)
+        fila = self.afd_perezoso.get(mascara)
+        if fila is None:
+            if len(self.afd_perezoso) >= self.max_estados:
+                self.afd_perezoso.clear()
+                self.vaciados += 1
+            fila = self.afd_perezoso[mascara] = {}
+        destino = fila.get(simbolo)
+        if destino is None:
+            destino = fila[simbolo] = self.afn_to_afd.paso_bits(mascara, simbolo)
+        return destino
+
+    def estados_activos(self, cadena):
+        """Subconjunto del AFN activo despues de leer la cadena"""
+        mascara = self.inicial
+        for simbolo in cadena:
+            if not mascara:
+                break
+            mascara = self._paso(mascara, simbolo)
+        return self.afn_to_afd.a_conjunto(mascara)
+
+    def aceptar(self, cadena):
+        mascara = self.inicial
+        for simbolo in cadena:
+            if not mascara:
+                return False
+            mascara = self._paso(mascara, simbolo)
+        return bool(mascara & self.finales)
+
+    def match_many(self, cadenas):
+        return [self.aceptar(cadena) for cadena in cadenas]
+
+    def estadisticas(self):
+        return {
+            'estados_materializados': len(self.afd_perezoso),
+            'transiciones_materializadas': sum(len(fila) for fila in self.afd_perezoso.values()),
+            'vaciados': self.vaciados,
+        }
+
+
+def _conversor_bits(automata):
+    if isinstance(automata, AFNtoAFDBits):
+        return automata
+    if isinstance(automata, AFNtoAFD):
+        return AFNtoAFDBits(automata.estados, automata.alfabeto, automata.transiciones,
+                            automata.estado_inicial, automata.estados_finales)
+    if isinstance(automata, AFN):
+        return construir_conversor(automata, AFNtoAFDBits)
+    raise TypeError(f"SimuladorAFN necesita un AFN, AFNtoAFD o AFNtoAFDBits, no {type(automata).__name__}")
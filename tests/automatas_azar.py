@@ -0,0 +1,61 @@
+"""Automatas al azar y una simulacion directa del AFN para comparar contra el motor"""
+import random
+from itertools import product
+
+
+def afn_azar(r, max_estados=7, max_transiciones=14, simbolos='abcd'):
+    """(estados, alfabeto, transiciones, inicial, finales) en la forma que recibe AFNtoAFD"""
+    n = r.randint(1, max_estados)
+    alfabeto = set(r.sample(simbolos, r.randint(1, 3)))
+    transiciones = {}
+    for _ in range(r.randint(0, max_transiciones)):
+        clave = (r.choice(sorted(alfabeto) + ['e']), f'q{r.randrange(n)}')
+        transiciones.setdefault(clave, set()).add(f'q{r.randrange(n)}')
+    estados = {f'q{i}' for i in range(n)}
+    finales = {estado for estado in sorted(estados) if r.random() < .4}
+    return estados, alfabeto, transiciones, 'q0', finales
+
+
+def casos(semilla, cantidad):
+    r = random.Random(semilla)
+    for _ in range(cantidad):
+        yield r, afn_azar(r)
+
+
+def _cerradura(transiciones, estados):
+    pila = list(estados)
+    cerrados = set(estados)
+    while pila:
+        for destino in transiciones.get(('e', pila.pop()), ()):
+            if destino not in cerrados:
+                cerrados.add(destino)
+                pila.append(destino)
+    return cerrados
+
+
+def acepta_afn(afn, cadena):
+    """Simula el AFN sin pasar por la construccion de subconjuntos"""
+    _, _, transiciones, inicial, finales = afn
+    actuales = _cerradura(transiciones, {inicial})
+    for simbolo in cadena:
+        siguientes = set()
+        for estado in actuales:
+            siguientes |= transiciones.get((simbolo, estado), set())
+        actuales = _cerradura(transiciones, siguientes)
+    return not actuales.isdisjoint(finales)
+
+
+def acepta_afd(afd, inicial, finales, cadena):
+    """Recorre un AFD en diccionario; una transicion que falta rechaza"""
+    estado = inicial
+    for simbolo in cadena:
+        estado = afd.get((estado, simbolo))
+        if estado is None:
+            return False
+    return estado in finales
+
+
+def cadenas_hasta(simbolos, largo):
+    for n in range(largo + 1):
+        for letras in product(sorted(simbolos), repeat=n):
+            yield ''.join(letras)
@@ -0,0 +1,34 @@
+"""AFN.agrupar y AFNCompacto contra las transiciones como conjuntos"""
+from motor_automatas import AFN, AFNCompacto
+from automatas_azar import casos
+
+
+def afn_desde(transiciones):
+    afn = AFN()
+    for origen, simbolo, destino in transiciones:
+        afn.agregar_transicion(afn.agregar_estado(origen), afn.agregar_simbolo(simbolo),
+                               afn.agregar_estado(destino))
+    return afn
+
+
+def test_agrupar_sin_repetidos_y_en_orden():
+    afn = afn_desde([('p', 'a', 'r'), ('p', 'a', 'q'), ('p', 'b', 'p'), ('p', 'a', 'r'), ('q', 'a', 'p'),
+                     ('p', 'a', 'p'), ('p', 'a', 'q')])
+    p, q, r = (afn.indice_estados[nombre] for nombre in 'pqr')
+    a, b = afn.indice_simbolos['a'], afn.indice_simbolos['b']
+    assert afn.agrupar() == {(p, a): [r, q, p], (p, b): [p], (q, a): [p]}
+
+
+def test_agrupar_con_muchos_destinos():
+    destinos = [f'd{i}' for i in range(5000)]
+    afn = afn_desde([('q', 'a', destino) for destino in destinos + destinos[::-1]])
+    (clave, agrupados), = afn.agrupar().items()
+    assert [afn.estados[d] for d in agrupados] == destinos
+
+
+def test_compacto_conserva_las_transiciones():
+    for _, (_, _, transiciones, _, _) in casos(9, 100):
+        tripletas = [(origen, simbolo, destino) for (simbolo, origen), destinos in sorted(transiciones.items())
+                     for destino in sorted(destinos)]
+        assert AFNCompacto.desde_afn(afn_desde(tripletas)).a_transiciones() == transiciones
+        assert AFNCompacto.desde_transiciones(transiciones).a_transiciones() == transiciones
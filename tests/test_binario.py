@@ -0,0 +1,60 @@
+"""Formato binario de AFDCompilado: guardar, cargar y la vista de NumPy de la tabla"""
+import pytest
+
+from motor_automatas import AFDCompilado, AFNtoAFD
+from motor_automatas import compilado as modulo_compilado
+from automatas_azar import casos
+
+
+def compilado_azar(semilla):
+    _, afn = next(casos(semilla, 1))
+    conversor = AFNtoAFD(*afn)
+    conversor.convertir()
+    return conversor.compilar()
+
+
+def test_guardar_y_cargar_conservan_la_tabla(tmp_path):
+    ruta = str(tmp_path / 'afd.bin')
+    for semilla in range(20):
+        compilado = compilado_azar(semilla)
+        compilado.guardar(ruta)
+        cargado = AFDCompilado.cargar(ruta)
+        assert cargado.simbolos == compilado.simbolos
+        assert cargado.estado_inicial == compilado.estado_inicial
+        assert list(cargado.tabla) == list(compilado.tabla)
+        assert list(cargado.aceptacion) == list(compilado.aceptacion)
+
+
+def test_cargar_rechaza_archivos_malos(tmp_path):
+    ruta = tmp_path / 'malo.bin'
+    ruta.write_bytes(b'XXXX' + bytes(60))
+    with pytest.raises(ValueError):
+        AFDCompilado.cargar(str(ruta))
+    compilado_azar(6).guardar(str(ruta))
+    ruta.write_bytes(ruta.read_bytes()[:-1])
+    with pytest.raises(ValueError):
+        AFDCompilado.cargar(str(ruta))
+
+
+def test_tabla_numpy_antes_que_cualquier_otro_camino(monkeypatch):
+    pytest.importorskip('numpy')
+    # Como en un proceso nuevo: NumPy todavia no se cargo
+    monkeypatch.setattr(modulo_compilado, 'np', None)
+    monkeypatch.setattr(modulo_compilado, '_numpy_buscado', False)
+    compilado = compilado_azar(7)
+    n = len(compilado.aceptacion)
+    k = len(compilado.simbolos)
+    tabla = compilado.tabla_numpy()
+    assert tabla.shape == (n + 1, k + 1)
+    assert (tabla[n] == n).all() and (tabla[:, k] == n).all()
+    for i in range(n):
+        for j in range(k):
+            destino = compilado.tabla[i * k + j]
+            assert tabla[i, j] == (destino if destino >= 0 else n)
+
+
+def test_tabla_numpy_sin_numpy(monkeypatch):
+    monkeypatch.setattr(modulo_compilado, 'np', None)
+    monkeypatch.setattr(modulo_compilado, '_numpy_buscado', True)
+    with pytest.raises(ImportError):
+        compilado_azar(8).tabla_numpy()
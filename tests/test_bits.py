@@ -0,0 +1,33 @@
+"""AFNtoAFDBits contra AFNtoAFD: mismas cerraduras, mismos pasos y mismo AFD"""
+import pytest
+
+from motor_automatas import AFNtoAFD, AFNtoAFDBits
+from automatas_azar import casos
+
+
+def test_cerradura_y_paso_por_subconjunto():
+    for r, afn in casos(13, 150):
+        conjuntos = AFNtoAFD(*afn)
+        bits = AFNtoAFDBits(*afn)
+        for _ in range(10):
+            subconjunto = frozenset(r.sample(sorted(afn[0]), r.randint(0, len(afn[0]))))
+            mascara = bits.a_mascara(subconjunto)
+            assert bits.a_conjunto(mascara) == subconjunto
+            assert bits.a_conjunto(bits.cerradura_bits(mascara)) == conjuntos.cerradura_e(subconjunto)
+            for simbolo in sorted(afn[1]):
+                assert bits.a_conjunto(bits.mueve_cerrado_bits(mascara, simbolo)) == \
+                    conjuntos.mueve_cerrado(subconjunto, simbolo)
+
+
+@pytest.mark.parametrize('minimizar', [False, True])
+def test_mismo_afd(minimizar):
+    for _, afn in casos(2, 200):
+        resultados = []
+        for clase in (AFNtoAFD, AFNtoAFDBits):
+            conversor = clase(*afn)
+            conversor.convertir()
+            if minimizar:
+                conversor.minimizar()
+            resultados.append((conversor.afd, conversor.estados_afd, conversor.estado_inicial_afd,
+                               conversor.obtener_estados_finales_afd()))
+        assert resultados[0] == resultados[1]
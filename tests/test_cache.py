@@ -0,0 +1,75 @@
+"""huella_afn y CacheDisco"""
+import os
+import shutil
+
+from motor_automatas import CacheDisco, huella_afn, leer_afn, preparar_afd
+from motor_automatas import cache as modulo_cache
+
+TEXTO = "Q={p,q,r}\nZ={a,b}\ni=p\nA={r}\nw={(p,a,q);(q,b,r);(p,e,r)}"
+
+
+def test_huella_no_depende_del_orden_ni_de_repetidos():
+    otro = "Q={r,q,p}\nZ={b,a}\ni=p\nA={r}\nw={ (q,b,r) ; (p,e,r);(p,a,q);(p,a,q) }"
+    assert huella_afn(leer_afn(TEXTO)) == huella_afn(leer_afn(otro))
+
+
+def test_huella_cambia_con_el_automata_y_con_minimizar():
+    base = huella_afn(leer_afn(TEXTO))
+    assert huella_afn(leer_afn(TEXTO), minimizar=False) != base
+    assert huella_afn(leer_afn(TEXTO.replace('A={r}', 'A={q}'))) != base
+    assert huella_afn(leer_afn(TEXTO.replace('(q,b,r)', '(q,a,r)'))) != base
+    assert huella_afn(leer_afn(TEXTO.replace('i=p', 'i=q'))) != base
+
+
+def test_guardar_y_obtener(tmp_path):
+    cache = CacheDisco(str(tmp_path))
+    assert cache.obtener('x') is None
+    cache.guardar('x', {'valor': 1})
+    assert cache.obtener('x') == {'valor': 1}
+    # Otra instancia sobre la misma carpeta ve lo guardado
+    assert CacheDisco(str(tmp_path)).obtener('x') == {'valor': 1}
+    assert cache.estadisticas()['aciertos'] == 1 and cache.estadisticas()['fallos'] == 1
+
+
+def test_descarta_la_usada_hace_mas_tiempo(tmp_path):
+    valor = b'x' * 1000
+    cache = CacheDisco(str(tmp_path), tamano_maximo=2500)
+    cache.guardar('a', valor)
+    cache.guardar('b', valor)
+    cache.obtener('a')
+    cache.guardar('c', valor)
+    assert cache.obtener('b') is None
+    assert cache.obtener('a') == valor and cache.obtener('c') == valor
+    assert cache.descartes == 1
+    assert sorted(os.listdir(tmp_path)) == ['a.pickle', 'c.pickle']
+    # Un valor que no cabe ni solo no se guarda
+    cache.guardar('d', b'x' * 5000)
+    assert cache.obtener('d') is None
+
+
+def test_archivo_danado_cuenta_como_fallo(tmp_path):
+    cache = CacheDisco(str(tmp_path))
+    cache.guardar('x', [1, 2, 3])
+    (tmp_path / 'x.pickle').write_bytes(b'no es un pickle')
+    assert cache.obtener('x') is None
+    assert not (tmp_path / 'x.pickle').exists()
+
+
+def test_error_al_escribir_no_es_error_de_conversion(tmp_path):
+    carpeta = tmp_path / 'cache'
+    cache = CacheDisco(str(carpeta))
+    afn = leer_afn(TEXTO)
+    shutil.rmtree(carpeta)
+    assert preparar_afd(afn, cache=cache) == preparar_afd(afn)
+    assert cache.obtener(huella_afn(afn)) is None
+
+
+def test_error_al_renombrar_no_deja_temporales(tmp_path, monkeypatch):
+    cache = CacheDisco(str(tmp_path))
+
+    def falla(origen, destino):
+        raise OSError("disco lleno")
+    monkeypatch.setattr(modulo_cache.os, 'replace', falla)
+    cache.guardar('x', [1])
+    assert os.listdir(tmp_path) == []
+    assert cache.obtener('x') is None
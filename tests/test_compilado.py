@@ -0,0 +1,51 @@
+"""AFDCompilado.aceptar, estado_final y match_many contra el AFD en diccionario"""
+from motor_automatas import AFDCompilado, AFNtoAFD
+from automatas_azar import acepta_afd, casos
+
+
+def afd_azar(r, afn):
+    """AFD de la conversion al que le faltan algunas transiciones, para que la tabla tenga huecos (-1)"""
+    conversor = AFNtoAFD(*afn)
+    conversor.convertir()
+    if r.random() < .5:
+        conversor.minimizar()
+    afd = {clave: destino for clave, destino in conversor.afd.items() if r.random() < .85}
+    return afd, conversor.estado_inicial_afd, set(conversor.obtener_estados_finales_afd()), \
+        sorted(conversor.alfabeto - {'e'})
+
+
+def test_aceptar_y_match_many():
+    for r, afn in casos(4, 150):
+        afd, inicial, finales, simbolos = afd_azar(r, afn)
+        compilado = AFDCompilado.desde_afd(afd, inicial, finales, simbolos)
+        # 'x' no es simbolo de ningun AFD: lleva al estado muerto
+        cadenas = [''.join(r.choice('abcdx') for _ in range(r.randint(0, 8))) for _ in range(40)]
+        esperado = [acepta_afd(afd, inicial, finales, cadena) for cadena in cadenas]
+        assert [compilado.aceptar(cadena) for cadena in cadenas] == esperado
+        assert compilado.match_many(cadenas) == esperado
+        assert compilado.match_many([list(cadena) for cadena in cadenas]) == esperado
+
+
+def test_estado_final():
+    for r, afn in casos(14, 100):
+        afd, inicial, finales, simbolos = afd_azar(r, afn)
+        compilado = AFDCompilado.desde_afd(afd, inicial, finales, simbolos)
+        for _ in range(20):
+            cadena = ''.join(r.choice('abcdx') for _ in range(r.randint(0, 6)))
+            estado = inicial
+            for simbolo in cadena:
+                estado = afd.get((estado, simbolo))
+                if estado is None:
+                    break
+            fila = compilado.estado_final(cadena)
+            assert (fila == -1) == (estado is None)
+            if estado is not None:
+                assert compilado.estados[fila] == estado
+
+
+def test_simbolos_de_varios_caracteres():
+    # Sin str.translate: las cadenas son secuencias de simbolos
+    afd = {('p', 'uno'): 'q', ('q', 'dos'): 'p', ('q', 'uno'): 'q'}
+    compilado = AFDCompilado.desde_afd(afd, 'p', {'q'})
+    assert compilado.match_many([['uno'], ['uno', 'dos'], ['uno', 'uno'], ['dos'], [], ['tres']]) == \
+        [True, False, True, False, False, False]
@@ -0,0 +1,89 @@
+"""escanear_archivo y sus dos recorridos (memoryview y NumPy por ventanas) contra aceptar"""
+import mmap
+
+import pytest
+
+from motor_automatas import AFDCompilado, AFNtoAFD
+from motor_automatas.compilado import cargar_numpy
+from automatas_azar import casos
+
+
+def compilados_azar(semilla, cantidad=100):
+    for r, afn in casos(semilla, cantidad):
+        conversor = AFNtoAFD(*afn)
+        conversor.convertir()
+        afd = {clave: destino for clave, destino in conversor.afd.items() if r.random() < .85}
+        yield r, AFDCompilado.desde_afd(afd, conversor.estado_inicial_afd, conversor.obtener_estados_finales_afd(),
+                                        sorted(conversor.alfabeto - {'e'}))
+
+
+def esperado_escaneo(compilado, texto, modo):
+    """Coincidencias (inicio, fin) que deberia reportar escanear_archivo, segun aceptar"""
+    coincidencias = []
+    pos = 0
+    lineas = texto.split('\n')
+    if lineas[-1] == '':
+        lineas.pop()
+    for linea in lineas:
+        if modo == 'lineas':
+            if compilado.aceptar(linea):
+                coincidencias.append((pos, pos + len(linea)))
+        else:
+            coincidencias.extend((pos, pos + i) for i in range(len(linea) + 1) if compilado.aceptar(linea[:i]))
+        pos += len(linea) + 1
+    return coincidencias, len(lineas)
+
+
+def escaneres(compilado, ruta, modo):
+    """Resultado de escanear_archivo y de cada recorrido interno sobre el mismo mapa"""
+    resultados = [compilado.escanear_archivo(ruta, modo)]
+    traduccion = compilado._tabla_bytes()
+    with open(ruta, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+        resultados.append(compilado._escanear_memoryview(mapa, modo, b'\n', traduccion, True))
+        if cargar_numpy() is not None:
+            # Ventanas chicas para que las lineas crucen de una ventana a otra
+            for ventana in (1, 3, 7, 1 << 20):
+                resultados.append(compilado._escanear_numpy(mapa, modo, b'\n', traduccion, True, ventana))
+    return resultados
+
+
+@pytest.mark.parametrize('modo', ['lineas', 'prefijos'])
+def test_escaneres_contra_aceptar(tmp_path, modo):
+    ruta = str(tmp_path / 'entrada.txt')
+    for r, compilado in compilados_azar(5):
+        # 'x' no es simbolo de ningun AFD: lleva al estado muerto
+        lineas = [''.join(r.choice('abcdx') for _ in range(r.randint(0, 8))) for _ in range(r.randint(1, 40))]
+        texto = '\n'.join(lineas) + r.choice(['', '\n'])
+        if not texto:
+            continue
+        with open(ruta, 'w', newline='') as f:
+            f.write(texto)
+        coincidencias, total = esperado_escaneo(compilado, texto, modo)
+        for resultado in escaneres(compilado, ruta, modo):
+            assert resultado.lineas == total
+            assert resultado.conteo == len(coincidencias)
+            assert sorted(resultado.coincidencias) == coincidencias
+
+
+def test_archivo_vacio_y_sin_posiciones(tmp_path):
+    _, compilado = next(compilados_azar(15, 1))
+    vacio = tmp_path / 'vacio.txt'
+    vacio.write_bytes(b'')
+    resultado = compilado.escanear_archivo(str(vacio))
+    assert (resultado.coincidencias, resultado.lineas, resultado.conteo) == ([], 0, 0)
+    ruta = tmp_path / 'entrada.txt'
+    ruta.write_bytes(b'\n'.join(s.encode() for s in compilado.simbolos) + b'\n\n')
+    completo = compilado.escanear_archivo(str(ruta))
+    sin_posiciones = compilado.escanear_archivo(str(ruta), guardar_posiciones=False)
+    assert sin_posiciones.coincidencias == []
+    assert (sin_posiciones.lineas, sin_posiciones.conteo) == (completo.lineas, completo.conteo)
+
+
+def test_argumentos_invalidos(tmp_path):
+    _, compilado = next(compilados_azar(15, 1))
+    ruta = tmp_path / 'entrada.txt'
+    ruta.write_bytes(b'a\n')
+    with pytest.raises(ValueError):
+        compilado.escanear_archivo(str(ruta), modo='todo')
+    with pytest.raises(ValueError):
+        compilado.escanear_archivo(str(ruta), separador=b'\r\n')
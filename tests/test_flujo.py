@@ -0,0 +1,63 @@
+"""buscar_en_flujo con registros partidos entre bloques"""
+import io
+
+import pytest
+
+from motor_automatas import AFDCompilado, AFNtoAFD
+from automatas_azar import casos
+
+
+def compilados_azar(semilla, cantidad=80):
+    for r, afn in casos(semilla, cantidad):
+        conversor = AFNtoAFD(*afn)
+        conversor.convertir()
+        afd = {clave: destino for clave, destino in conversor.afd.items() if r.random() < .85}
+        yield r, AFDCompilado.desde_afd(afd, conversor.estado_inicial_afd, conversor.obtener_estados_finales_afd(),
+                                        sorted(conversor.alfabeto - {'e'}))
+
+
+def esperado(compilado, texto, separador):
+    """Desplazamiento de cada registro aceptado, segun aceptar"""
+    registros = texto.split(separador)
+    if registros[-1] == '':
+        registros.pop()
+    desplazamientos = []
+    pos = 0
+    for registro in registros:
+        if compilado.aceptar(registro):
+            desplazamientos.append(pos)
+        pos += len(registro) + 1
+    return desplazamientos
+
+
+def partir(r, texto):
+    """El texto en trozos de largo al azar, algunos vacios"""
+    trozos = []
+    pos = 0
+    while pos < len(texto):
+        largo = r.randint(0, 5)
+        trozos.append(texto[pos:pos + largo])
+        pos += largo
+    return trozos
+
+
+@pytest.mark.parametrize('separador', ['\n', ';'])
+def test_bloques_de_cualquier_tamano(separador):
+    for r, compilado in compilados_azar(16):
+        registros = [''.join(r.choice('abcdx') for _ in range(r.randint(0, 7))) for _ in range(r.randint(0, 30))]
+        texto = separador.join(registros) + r.choice(['', separador])
+        esperados = esperado(compilado, texto, separador)
+        sep = separador.encode()
+        for tam_bloque in (1, 2, 3, 7, 1 << 16):
+            fuente = io.BytesIO(texto.encode())
+            assert list(compilado.buscar_en_flujo(fuente, tam_bloque, sep)) == esperados
+        # Iterador de bloques str y bytes partidos en cualquier lugar
+        assert list(compilado.buscar_en_flujo(iter(partir(r, texto)), separador=sep)) == esperados
+        trozos = [trozo.encode() for trozo in partir(r, texto)]
+        assert list(compilado.buscar_en_flujo(trozos, separador=sep)) == esperados
+
+
+def test_separador_de_un_byte():
+    _, compilado = next(compilados_azar(17, 1))
+    with pytest.raises(ValueError):
+        list(compilado.buscar_en_flujo(io.BytesIO(b'a'), separador=b'\r\n'))
@@ -0,0 +1,61 @@
+"""convertir(anterior) despues de editar el AFN contra una conversion completa"""
+import pytest
+
+from motor_automatas import AFNtoAFD, AFNtoAFDBits
+from automatas_azar import casos
+
+
+def convertido(afn, clase=AFNtoAFD, minimizar=False, anterior=None):
+    conversor = clase(*afn)
+    conversor.convertir(anterior)
+    if minimizar:
+        conversor.minimizar()
+    return conversor
+
+
+def editar(r, afn):
+    """Copia del AFN con algunas transiciones o finales agregados o quitados, como una edicion en la interfaz"""
+    estados, alfabeto, transiciones, inicial, finales = afn
+    transiciones = {clave: set(destinos) for clave, destinos in transiciones.items()}
+    finales = set(finales)
+    nombres = sorted(estados)
+    for _ in range(r.randint(1, 3)):
+        cambio = r.random()
+        if cambio < .4 and transiciones:
+            clave = r.choice(sorted(transiciones))
+            transiciones[clave].discard(r.choice(sorted(transiciones[clave])))
+            if not transiciones[clave]:
+                del transiciones[clave]
+        elif cambio < .8:
+            clave = (r.choice(sorted(alfabeto) + ['e']), r.choice(nombres))
+            transiciones.setdefault(clave, set()).add(r.choice(nombres))
+        else:
+            finales ^= {r.choice(nombres)}
+    return estados, alfabeto, transiciones, inicial, finales
+
+
+@pytest.mark.parametrize('minimizar_anterior', [False, True])
+def test_incremental_igual_a_completa(minimizar_anterior):
+    for r, afn in casos(1, 200):
+        anterior = convertido(afn, minimizar=minimizar_anterior)
+        editado = editar(r, afn)
+        completa = convertido(editado)
+        incremental = convertido(editado, anterior=anterior)
+        assert incremental.afd == completa.afd
+        assert incremental.estados_afd == completa.estados_afd
+        assert incremental.obtener_estados_finales_afd() == completa.obtener_estados_finales_afd()
+
+
+@pytest.mark.parametrize('clase', [AFNtoAFD, AFNtoAFDBits])
+def test_cadena_de_ediciones(clase):
+    # Como en la interfaz: cada conversion reutiliza la anterior, ya minimizada
+    for r, afn in casos(12, 40):
+        anterior = None
+        for _ in range(5):
+            afn = editar(r, afn)
+            actual = convertido(afn, clase, anterior=anterior)
+            completa = convertido(afn)
+            assert actual.afd == completa.afd
+            assert actual.estados_afd == completa.estados_afd
+            actual.minimizar()
+            anterior = actual
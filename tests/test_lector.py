@@ -0,0 +1,55 @@
+"""Lectura del formato Q=/Z=/i=/A=/w="""
+import pytest
+
+from motor_automatas import leer_afn, leer_afn_archivo, leer_archivo
+from motor_automatas.lector import formatear_automata
+
+TEXTO = "Q={q0,q1,q2}\nZ={a,b}\ni=q0\nA={q2}\nw={(q0,a,q1);(q1,b,q2);(q0,e,q2)}\n"
+
+
+def test_lee_todas_las_lineas():
+    afn = leer_afn(TEXTO)
+    assert afn.estados == ['q0', 'q1', 'q2'] and afn.declarados_q == 3
+    assert afn.simbolos[:afn.declarados_z] == ['a', 'b']
+    assert afn.estado_inicial() == 'q0'
+    assert [afn.estados[i] for i in afn.finales] == ['q2']
+    assert list(afn.transiciones()) == [('q0', 'a', 'q1'), ('q1', 'b', 'q2'), ('q0', 'e', 'q2')]
+
+
+def test_espacios_y_separadores():
+    afn = leer_afn("  Q = { q0 , q1 }\r\nZ={a}\r\n i=q0\r\nA={q1}\r\nw = { ( q0 , a , q1 ) ;\t(q1,a,q1) }\r\n")
+    assert afn.estados == ['q0', 'q1']
+    assert list(afn.transiciones()) == [('q0', 'a', 'q1'), ('q1', 'a', 'q1')]
+    assert leer_afn(b"w={(p,a,q)}").estado_inicial() == 'p'
+
+
+@pytest.mark.parametrize('texto, linea, columna', [
+    ("Q={A,B}\nw={(A,a,B);(A,b)}", 2, 12),
+    ("w={(q 1,a,B)}", 1, 4),
+    ("Q={A,(B}", 1, 6),
+    ("Q={A}\nZ={a}\nw={(A,a,A) x}", 3, 12),
+])
+def test_errores_con_linea_y_columna(texto, linea, columna):
+    with pytest.raises(ValueError, match=f"linea {linea}, columna {columna}:"):
+        leer_afn(texto)
+
+
+def test_archivo_igual_que_texto(tmp_path):
+    ruta = tmp_path / 'automata.txt'
+    ruta.write_text(TEXTO)
+    afn = leer_afn_archivo(str(ruta))
+    assert list(afn.transiciones()) == list(leer_afn(TEXTO).transiciones())
+    assert leer_archivo(str(ruta))['estados_finales_a'] == ['q2']
+    vacio = tmp_path / 'vacio.txt'
+    vacio.write_text('')
+    assert len(leer_afn_archivo(str(vacio))) == 0
+    malo = tmp_path / 'malo.txt'
+    malo.write_text("w={(A,a,B);(A,b)}")
+    with pytest.raises(ValueError, match="linea 1, columna 12"):
+        leer_afn_archivo(str(malo))
+
+
+def test_formatear_y_volver_a_leer():
+    afn = leer_afn(TEXTO)
+    texto = formatear_automata(afn.estados, ['a', 'b'], 'q0', ['q2'], list(afn.transiciones()))
+    assert list(leer_afn(texto).transiciones()) == list(afn.transiciones())
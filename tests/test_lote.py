@@ -0,0 +1,56 @@
+"""Conversion por lotes: nombres de salida, validacion de -j y archivos escritos"""
+import os
+
+import pytest
+
+from motor_automatas import AFDCompilado, leer_afn_archivo
+from motor_automatas.lote import main, nombres_salida
+
+TEXTO = "Q={q0,q1}\nZ={a,b}\ni=q0\nA={q1}\nw={(q0,a,q1);(q1,b,q0)}\n"
+
+
+def test_nombres_sin_choques():
+    assert nombres_salida(['d1/x.txt', 'd2/y.txt', 'z.txt']) == ['x', 'y', 'z']
+
+
+def test_nombres_con_choques_conservan_las_carpetas(tmp_path):
+    rutas = [str(tmp_path / 'd1' / 'x.txt'), str(tmp_path / 'd2' / 'x.txt'), str(tmp_path / 'd2' / 'sub' / 'y.txt')]
+    assert nombres_salida(rutas) == [os.path.join('d1', 'x'), os.path.join('d2', 'x'),
+                                     os.path.join('d2', 'sub', 'y')]
+
+
+def test_nombres_que_siguen_chocando():
+    with pytest.raises(ValueError, match=r'x\.afd\.txt'):
+        nombres_salida(['d/x.txt', 'd/x.afn'])
+
+
+@pytest.mark.parametrize('valor', ['0', '-2', 'dos'])
+def test_trabajadores_invalidos(valor, tmp_path, capsys):
+    with pytest.raises(SystemExit):
+        main([str(tmp_path), '-j', valor])
+    assert '-j' in capsys.readouterr().err
+
+
+def test_convierte_carpetas_con_nombres_repetidos(tmp_path):
+    for carpeta in ('d1', 'd2'):
+        os.makedirs(tmp_path / carpeta)
+        (tmp_path / carpeta / 'x.txt').write_text(TEXTO)
+    (tmp_path / 'd2' / 'malo.txt').write_text("w={(q0,a)}")
+    salida = tmp_path / 'salida'
+    codigo = main([str(tmp_path / 'd1'), str(tmp_path / 'd2'), '-j', '1', '-o', str(salida), '--binario'])
+    assert codigo == 1  # malo.txt falla, pero no detiene a los demas
+    for carpeta in ('d1', 'd2'):
+        afd = leer_afn_archivo(str(salida / carpeta / 'x.afd.txt'))
+        assert afd.estado_inicial() == 'A'
+        compilado = AFDCompilado.cargar(str(salida / carpeta / 'x.afd.bin'))
+        assert compilado.match_many(['a', 'ab', 'aba', 'b', '']) == [True, False, True, False, False]
+    assert not (salida / 'd2' / 'malo.afd.txt').exists()
+
+
+def test_salidas_que_chocan_no_convierten_nada(tmp_path, capsys):
+    (tmp_path / 'x.txt').write_text(TEXTO)
+    (tmp_path / 'x.afn').write_text(TEXTO)
+    salida = tmp_path / 'salida'
+    assert main([str(tmp_path / 'x.txt'), str(tmp_path / 'x.afn'), '-o', str(salida)]) == 1
+    assert 'mismo archivo' in capsys.readouterr().err
+    assert not salida.exists()
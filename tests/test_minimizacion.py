@@ -0,0 +1,50 @@
+"""minimizar_afd contra un AFD minimo por fuerza bruta"""
+from motor_automatas import AFNtoAFD, minimizar_afd
+from automatas_azar import acepta_afn, cadenas_hasta, casos
+
+
+def clases_equivalencia(afd, estados, finales, simbolos):
+    """Numero de estados del AFD minimo por fuerza bruta: se marcan los pares
+    distinguibles hasta que no cambie nada (llenado de tabla)"""
+    distinguibles = {(p, q) for p in estados for q in estados if (p in finales) != (q in finales)}
+    cambio = True
+    while cambio:
+        cambio = False
+        for p in estados:
+            for q in estados:
+                if (p, q) not in distinguibles and any(
+                        (afd[(p, x)], afd[(q, x)]) in distinguibles for x in simbolos):
+                    distinguibles.add((p, q))
+                    cambio = True
+    clases = []
+    for estado in estados:
+        if not any((estado, clase[0]) not in distinguibles for clase in clases):
+            clases.append([estado])
+    return len(clases)
+
+
+def test_minimizar_contra_fuerza_bruta():
+    for _, afn in casos(3, 200):
+        conversor = AFNtoAFD(*afn)
+        conversor.convertir()
+        simbolos = sorted(conversor.alfabeto - {'e'})
+        esperados = clases_equivalencia(conversor.afd, conversor.estados_afd,
+                                        set(conversor.obtener_estados_finales_afd()), simbolos)
+        conversor.minimizar()
+        assert len(conversor.estados_afd) == esperados
+        finales = set(conversor.obtener_estados_finales_afd())
+        for cadena in cadenas_hasta(simbolos, 5):
+            estado = conversor.estado_inicial_afd
+            for simbolo in cadena:
+                estado = conversor.afd[(estado, simbolo)]
+            assert (estado in finales) == acepta_afn(afn, cadena), cadena
+
+
+def test_une_los_estados_equivalentes():
+    # q1 y q2 aceptan lo mismo: el AFD minimo los junta en un estado etiquetado con la union
+    a, b, c = frozenset({'q0'}), frozenset({'q1'}), frozenset({'q2'})
+    afd = {(a, 'x'): b, (a, 'y'): c, (b, 'x'): b, (b, 'y'): b, (c, 'x'): c, (c, 'y'): c}
+    minimo, finales, inicial = minimizar_afd(afd, [b, c], a)
+    union = frozenset({'q1', 'q2'})
+    assert inicial == a and finales == [union]
+    assert minimo == {(a, 'x'): union, (a, 'y'): union, (union, 'x'): union, (union, 'y'): union}
@@ -0,0 +1,46 @@
+"""Orden y nombres de los estados del AFD que muestran la tabla y el lote"""
+import pytest
+
+from motor_automatas import AFNtoAFD, AFNtoAFDBits, convertir_afn, leer_afn, mapear_estados, presentar_afd
+from motor_automatas.presentacion import nombres_letras
+from automatas_azar import casos
+
+
+def orden_de_descubrimiento(afd, inicial, simbolos):
+    orden = [inicial]
+    for estado in orden:
+        for simbolo in simbolos:
+            destino = afd.get((estado, simbolo))
+            if destino is not None and destino not in orden:
+                orden.append(destino)
+    return orden
+
+
+@pytest.mark.parametrize('clase', [AFNtoAFD, AFNtoAFDBits])
+@pytest.mark.parametrize('minimizar', [False, True])
+def test_estados_en_orden_de_descubrimiento(clase, minimizar):
+    # presentar_afd usa estados_afd tal cual: convertir() y minimizar() deben dejarlo en este orden
+    for _, afn in casos(11, 150):
+        conversor = clase(*afn)
+        conversor.convertir()
+        if minimizar:
+            conversor.minimizar()
+        afd, estados_afd, simbolos, _, mapeo = presentar_afd(conversor)
+        assert estados_afd == orden_de_descubrimiento(afd, conversor.estado_inicial_afd, simbolos)
+        assert mapeo[conversor.estado_inicial_afd] == next(iter(mapeo.values()))
+
+
+def test_nombres_despues_de_la_z():
+    nombres = list(zip(range(26 * 27 + 1), nombres_letras()))
+    assert [nombres[i][1] for i in (0, 25, 26, 27, 51, 52, 701, 702)] == \
+        ['A', 'Z', 'AA', 'AB', 'AZ', 'BA', 'ZZ', 'AAA']
+    estados = [frozenset({f'q{i}', 'x'}) for i in range(1000)]
+    assert len(set(mapear_estados(estados).values())) == 1000
+    with pytest.raises(ValueError):
+        mapear_estados(estados, 'romanos')
+
+
+def test_numeros_para_estados_de_letras():
+    conversor = convertir_afn(leer_afn("Q={A,B}\nZ={0,1}\ni=A\nA={B}\nw={(A,0,B);(A,1,A);(B,0,B);(B,1,A)}"), minimizar=False)
+    mapeo = presentar_afd(conversor)[4]
+    assert mapeo[frozenset({'A'})] == '1' and mapeo[frozenset({'B'})] == '2'
@@ -0,0 +1,27 @@
+"""SimuladorAFN contra una simulacion directa del AFN"""
+import pytest
+
+from motor_automatas import AFNtoAFD, AFNtoAFDBits, SimuladorAFN, leer_afn
+from automatas_azar import acepta_afn, cadenas_hasta, casos
+
+
+@pytest.mark.parametrize('clase', [AFNtoAFD, AFNtoAFDBits])
+@pytest.mark.parametrize('perezoso', [False, True])
+def test_igual_a_la_simulacion_directa(clase, perezoso):
+    for _, afn in casos(10, 100):
+        # max_estados chico para que el AFD perezoso se vacie durante la prueba
+        simulador = SimuladorAFN(clase(*afn), perezoso=perezoso, max_estados=3)
+        cadenas = list(cadenas_hasta(sorted(afn[1]) + ['x'], 4))
+        assert simulador.match_many(cadenas) == [acepta_afn(afn, cadena) for cadena in cadenas]
+
+
+def test_desde_afn_leido():
+    afn = leer_afn("Q={p,q,r}\nZ={a,b}\ni=p\nA={r}\nw={(p,a,q);(q,b,r);(p,e,r);(r,a,r)}")
+    simulador = SimuladorAFN(afn)
+    assert simulador.match_many(['', 'a', 'ab', 'aa', 'b', 'aab']) == [True, True, True, True, False, False]
+    assert simulador.estados_activos('a') == {'q', 'r'}
+
+
+def test_rechaza_otros_tipos():
+    with pytest.raises(TypeError):
+        SimuladorAFN({('a', 'q0'): {'q0'}})
@@ -0,0 +1,57 @@
+"""simular_lote con NumPy contra match_many"""
+import random
+import tracemalloc
+
+import pytest
+
+from motor_automatas import AFDCompilado, AFNtoAFD
+from motor_automatas.compilado import ACTIVAS_EN_PYTHON
+from automatas_azar import casos
+
+pytest.importorskip('numpy')
+
+
+def compilados(semilla, cantidad=60):
+    for r, afn in casos(semilla, cantidad):
+        conversor = AFNtoAFD(*afn)
+        conversor.convertir()
+        afd = {clave: destino for clave, destino in conversor.afd.items() if r.random() < .85}
+        yield r, AFDCompilado.desde_afd(afd, conversor.estado_inicial_afd, conversor.obtener_estados_finales_afd(),
+                                        sorted(conversor.alfabeto - {'e'}))
+
+
+def test_longitudes_mezcladas():
+    # Lotes con mas y con menos cadenas largas que ACTIVAS_EN_PYTHON, para pasar
+    # por los pasos de NumPy y por el final en Python
+    for r, compilado in compilados(7):
+        largas = r.choice([1, ACTIVAS_EN_PYTHON, 3 * ACTIVAS_EN_PYTHON])
+        cadenas = [''.join(r.choice('abcdx') for _ in range(r.randint(0, 4))) for _ in range(300)]
+        cadenas += [''.join(r.choice('abcd') for _ in range(r.randint(20, 200))) for _ in range(largas)]
+        r.shuffle(cadenas)
+        assert list(compilado.simular_lote(cadenas)) == compilado.match_many(cadenas)
+        # Simbolos como listas en lugar de str: camino sin str.translate
+        secuencias = [list(cadena) for cadena in cadenas]
+        assert list(compilado.simular_lote(secuencias, tam_lote=97)) == compilado.match_many(cadenas)
+
+
+def test_lote_vacio_y_cadenas_vacias():
+    _, compilado = next(compilados(8, 1))
+    assert list(compilado.simular_lote([])) == []
+    assert list(compilado.simular_lote(['', ''])) == compilado.match_many(['', ''])
+
+
+def test_memoria_proporcional_a_la_entrada():
+    conversor = AFNtoAFD({'q0'}, {'a'}, {('a', 'q0'): {'q0'}}, 'q0', {'q0'})
+    conversor.convertir()
+    compilado = conversor.compilar()
+    # Una cadena larga entre muchas cortas no debe reservar (mas larga) x (cadenas)
+    cadenas = ['aa'] * 20000 + ['a' * 20000]
+    compilado.simular_lote(cadenas[:1])
+    tracemalloc.start()
+    try:
+        resultado = compilado.simular_lote(cadenas)
+        pico = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert resultado.all()
+    assert pico < 20 * 1024 * 1024